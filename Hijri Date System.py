@@ -2,7 +2,9 @@
 Complete usage examples for the Hijri Date System with HijriDateMapper integration.
 """
 
-import pandas as pd
+import logging
+import numpy as np
+from collections import defaultdict, namedtuple
 from typing import Optional
 
 # Import the Hijri date system (assumes the main code is in hijri_dates.py)
@@ -20,27 +22,272 @@ sample_data = {
     'hijri_method': ['ISNA', 'ISNA', 'ISNA', 'ISNA', 'ISNA', 'ISNA', 'ISNA', 'ISNA']
 }
 
+logger = logging.getLogger(__name__)
+
+# Known Hijri calculation methods, in category-code order
+HIJRI_METHODS = ['ISNA', 'UmmAlQura', 'MCW']
+
+# Shared "no match" result for the lookup tables
+_EMPTY_POS = np.empty(0, dtype=np.int64)
+
+# Compact row layout for the date columns: 8 bytes per row instead of 48
+_DATE_RECORD = np.dtype([
+    ('g_year', np.int16), ('g_month', np.int8), ('g_day', np.int8),
+    ('h_year', np.int16), ('h_month', np.int8), ('h_day', np.int8),
+])
+
+# One mapping row's date fields, as returned by HijriDateMapper.first_row
+DateRow = namedtuple('DateRow', _DATE_RECORD.names)
+
+def _as_int(value):
+    """
+    Return a query component as an int, or None if it is not integral.
+    
+    Matches the lookup tables, whose dict keys also match an integral float
+    such as 1445.0 and nothing for 1445.5 or '1445'.
+    """
+    try:
+        number = int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return number if number == value else None
+
+
+# Query precision codes, see HijriDateMapper._dtype_code
+_DTYPE_INVALID = -1
+_DTYPE_DATE = 0
+_DTYPE_YM = 1
+_DTYPE_Y = 2
+_DTYPE_NAMES = {
+    _DTYPE_DATE: "date",
+    _DTYPE_YM: "month_range",
+    _DTYPE_Y: "year_range",
+    _DTYPE_INVALID: "invalid",
+}
+
+
+def _narrow_column(name, values):
+    """
+    Return a date column in its _DATE_RECORD dtype.
+    
+    Raises ValueError instead of letting a plain astype wrap out-of-range
+    values (a year of 40000 would become -25536 and match the wrong keys).
+    """
+    values = np.asarray(values)
+    dtype = _DATE_RECORD[name]
+    if values.size and values.dtype != dtype:
+        limits = np.iinfo(dtype)
+        low, high = values.min(), values.max()
+        if low < limits.min or high > limits.max:
+            raise ValueError(f"{name} values must lie within {limits.min}..{limits.max}, "
+                             f"got {low}..{high}")
+    return values.astype(dtype, copy=False)
+
+
+def _pack_key(years, months, days):
+    """Pack (year, month, day) into a single int32 key: year<<18 | month<<5 | day."""
+    return (years.astype(np.int32) << 18) | (months.astype(np.int32) << 5) | days.astype(np.int32)
+
 
 class HijriDateMapper:
-    def __init__(self, data=None):
+    def __init__(self, data=None, build_index: bool = True):
+        # pandas is only needed once a mapper exists, so the plain date
+        # arithmetic demos don't pay for importing it
+        import pandas as pd
+        self._pd = pd
+        self._build_index = build_index
         if data is None:
-            self.df = pd.DataFrame(sample_data)
+            # Narrow int16/int8 columns, matching the record layout used for lookups
+            columns = {name: _narrow_column(name, sample_data[name])
+                       for name in _DATE_RECORD.names}
+            columns['hijri_method'] = pd.Categorical(sample_data['hijri_method'], categories=HIJRI_METHODS)
+            self.df = pd.DataFrame(columns)
         else:
             self.df = data
+    
+    def describe(self):
+        """Print the size of the mapping data and its first rows."""
         print(f"Loaded {len(self.df)} date mappings")
         print("Sample data:")
         print(self.df.head())
     
+    @property
+    def df(self) -> 'pd.DataFrame':
+        """The mapping data backing every lookup."""
+        return self._df
+    
+    @df.setter
+    def df(self, data: 'pd.DataFrame'):
+        # Everything below is derived from the data, so rebuild it on reassignment
+        self._df = data
+        # Index labels as a plain array, read positionally for first/last matches
+        self._labels = data.index.to_numpy()
+        # All date columns in one contiguous record array; keys and tables derive from it
+        self._rec = np.rec.fromarrays(
+            [_narrow_column(name, data[name].to_numpy()) for name in _DATE_RECORD.names],
+            dtype=_DATE_RECORD)
+        if 'hijri_method' in data:
+            # int8 category codes, so method filters compare integers, not strings
+            methods = data['hijri_method']
+            if not isinstance(methods.dtype, self._pd.CategoricalDtype):
+                methods = methods.astype('category')
+            self._method_categories = methods.cat.categories
+            self._method_code = methods.cat.codes.to_numpy()
+        else:
+            self._method_categories = self._method_code = None
+        g_cols = (self._rec.g_year, self._rec.g_month, self._rec.g_day)
+        h_cols = (self._rec.h_year, self._rec.h_month, self._rec.h_day)
+        g_key, h_key = _pack_key(*g_cols), _pack_key(*h_cols)
+        # Sorted packed keys: any date, month or year is one contiguous slice
+        self._g_keys = self._sort_keys(g_key)
+        self._h_keys = self._sort_keys(h_key)
+        # Hash index over distinct keys, for batch conversions
+        self._g_key_index = self._key_index(g_key)
+        self._h_key_index = self._key_index(h_key)
+        if self._build_index:
+            # Precomputed (y, m, d) / (y, m) / (y) -> row positions, one set per calendar
+            g_tables, h_tables = self._build_lookup(*g_cols), self._build_lookup(*h_cols)
+        else:
+            g_tables = h_tables = None
+        self._g_match = self._make_matcher(g_tables, self._g_keys)
+        self._h_match = self._make_matcher(h_tables, self._h_keys)
+    
+    @staticmethod
+    def _sort_keys(key: np.ndarray):
+        """Return (sorted_key, order); order is None when key is already sorted."""
+        if np.all(key[:-1] <= key[1:]):
+            return key, None
+        order = np.argsort(key, kind='stable')
+        return key[order], order
+    
+    def _key_index(self, key: np.ndarray):
+        """Return (pd.Index of distinct keys, row position of each key's first row)."""
+        distinct, first_rows = np.unique(key, return_index=True)
+        return self._pd.Index(distinct), first_rows
+    
+    def _build_lookup(self, years: np.ndarray, months: np.ndarray, days: np.ndarray):
+        """Map every (year, month, day), (year, month) and year to its row positions."""
+        ymd, ym, y = defaultdict(list), defaultdict(list), defaultdict(list)
+        for pos, (yy, mm, dd) in enumerate(zip(years.tolist(), months.tolist(), days.tolist())):
+            ymd[(yy, mm, dd)].append(pos)
+            ym[(yy, mm)].append(pos)
+            y[yy].append(pos)
+        return tuple(
+            {key: np.asarray(rows, dtype=np.int64) for key, rows in table.items()}
+            for table in (ymd, ym, y)
+        )
+    
+    def _make_matcher(self, tables, keys):
+        """
+        Specialize the lookup for one calendar into a (year, month, day) -> positions function.
+        
+        The calendar's tables or keys are bound in the closure, so a call neither
+        re-resolves them nor re-checks which lookup structure is in use.
+        """
+        if tables is None:
+            search, dtype_code = self._search_positions, self._dtype_code
+            
+            def match(year, month, day):
+                return search(keys, year, month, day, dtype_code(year, month, day))
+            return match
+        
+        ymd, ym, y = tables
+        
+        def match(year, month, day):
+            # Same precedence as _dtype_code
+            if year is None:
+                return _EMPTY_POS
+            if month is None:
+                return y.get(year, _EMPTY_POS)
+            if day is None:
+                return ym.get((year, month), _EMPTY_POS)
+            return ymd.get((year, month, day), _EMPTY_POS)
+        return match
+    
+    def _search_positions(self, keys, year, month, day, code):
+        """Return the row positions matching a query by binary-searching sorted packed keys."""
+        sorted_key, order = keys
+        if code == _DTYPE_INVALID:
+            return _EMPTY_POS
+        # The bit shifts below need ints; a float or string component would raise
+        year = _as_int(year)
+        if year is None:
+            return _EMPTY_POS
+        if code != _DTYPE_Y:
+            month = _as_int(month)
+            if month is None:
+                return _EMPTY_POS
+        if code == _DTYPE_DATE:
+            day = _as_int(day)
+            if day is None:
+                return _EMPTY_POS
+        # Values outside the packed bit widths would alias a neighbouring key
+        if not 0 <= year < 1 << 13:
+            return _EMPTY_POS
+        if code == _DTYPE_DATE:
+            if not (0 <= month < 1 << 13 and 0 <= day < 1 << 5):
+                return _EMPTY_POS
+            lo_key = hi_key = (year << 18) | (month << 5) | day
+        elif code == _DTYPE_YM:
+            if not 0 <= month < 1 << 13:
+                return _EMPTY_POS
+            lo_key = (year << 18) | (month << 5)
+            hi_key = lo_key | 0x1F
+        elif code == _DTYPE_Y:
+            lo_key = year << 18
+            hi_key = lo_key | 0x3FFFF
+        else:
+            return _EMPTY_POS
+        
+        lo = np.searchsorted(sorted_key, lo_key, 'left')
+        hi = np.searchsorted(sorted_key, hi_key, 'right')
+        if order is None:
+            return np.arange(lo, hi, dtype=np.int64)
+        # Keep matches in row order, as a mask scan would
+        return np.sort(order[lo:hi])
+    
+    def _dtype_code(self, year: Optional[int], month: Optional[int], day: Optional[int]) -> int:
+        """Return the precision of the date query as one of the _DTYPE_* codes."""
+        if year is None:
+            return _DTYPE_INVALID
+        if month is None:
+            return _DTYPE_Y
+        if day is None:
+            return _DTYPE_YM
+        return _DTYPE_DATE
+    
     def get_dtype(self, year: int, month: Optional[int], day: Optional[int]):
         """Determine the precision level of the date query."""
-        if year is not None and month is not None and day is not None:
-            return "date"
-        elif year is not None and month is not None:
-            return "month_range"  
-        elif year is not None:
-            return "year_range"
+        return _DTYPE_NAMES[self._dtype_code(year, month, day)]
+    
+    def _match(self, date_type: str, year: int, month: Optional[int], day: Optional[int]):
+        """Return the row positions matching a query on the Gregorian or Hijri columns."""
+        if date_type == 'gregorian':
+            return self._g_match(year, month, day)
+        else:  # hijri
+            return self._h_match(year, month, day)
+    
+    def _convert(self, date_type: str, year: int, month: Optional[int], day: Optional[int]):
+        """Shared body of to_hijri/to_greg: matching rows, first index and span."""
+        # Local bindings: skip the df property and repeated attribute loads
+        df, labels = self._df, self._labels
+        match = self._g_match if date_type == 'gregorian' else self._h_match
+        pos = match(year, month, day)
+        result = df.take(pos)
+        
+        if len(pos) == 0:
+            first_index = None
+            span = 0
+            if date_type == 'gregorian':
+                logger.debug("Hijri date for Gregorian %s-%s-%s not available in dataset", year, month, day)
+            else:
+                logger.debug("Gregorian date for Hijri %s-%s-%s not available in dataset", year, month, day)
         else:
-            return "invalid"
+            first_index = labels[pos[0]]
+            last_index = labels[pos[-1]]
+            span = last_index - first_index
+        
+        return result, first_index, span
     
     def to_hijri(self, year: int, month: Optional[int], day: Optional[int]):
         """
@@ -54,33 +301,7 @@ class HijriDateMapper:
             - first_index: int or None, DataFrame index of first match
             - span: int, number of rows spanned (last_index - first_index)
         """
-        dtype = self.get_dtype(year, month, day)
-        
-        if dtype == "date":
-            mask = ((self.df['g_year'] == year) & 
-                    (self.df['g_month'] == month) & 
-                    (self.df['g_day'] == day))
-            result = self.df[mask]
-        elif dtype == "month_range":
-            mask = ((self.df['g_year'] == year) & 
-                    (self.df['g_month'] == month))
-            result = self.df[mask]
-        elif dtype == "year_range":
-            mask = (self.df['g_year'] == year)
-            result = self.df[mask]
-        else:
-            result = pd.DataFrame()
-        
-        if result.empty:
-            first_index = None
-            span = 0
-            print(f"   ℹ  Hijri date for Gregorian {year}-{month}-{day} not available in dataset")
-        else:
-            first_index = result.index[0]
-            last_index = result.index[-1]
-            span = last_index - first_index
-        
-        return result, first_index, span
+        return self._convert('gregorian', year, month, day)
     
     def to_greg(self, year: int, month: Optional[int], day: Optional[int]):
         """
@@ -94,61 +315,127 @@ class HijriDateMapper:
             - first_index: int or None, DataFrame index of first match
             - span: int, number of rows spanned (last_index - first_index)
         """
-        dtype = self.get_dtype(year, month, day)
-        
-        if dtype == "date":
-            mask = ((self.df['h_year'] == year) &
-                    (self.df['h_month'] == month) &
-                    (self.df['h_day'] == day))
-            result = self.df[mask]
-        elif dtype == "month_range":
-            mask = ((self.df['h_year'] == year) &
-                    (self.df['h_month'] == month))
-            result = self.df[mask]
-        elif dtype == "year_range":
-            mask = (self.df['h_year'] == year)
-            result = self.df[mask]
-        else:
-            result = pd.DataFrame()
-        
-        if result.empty:
-            first_index = None
-            span = 0
-            print(f"   ℹ  Gregorian date for Hijri {year}-{month}-{day} not available in dataset")
-        else:
-            first_index = result.index[0]
-            last_index = result.index[-1]
-            span = last_index - first_index
+        return self._convert('hijri', year, month, day)
+    
+    def first_row(self, year: int, month: Optional[int], day: Optional[int], date_type: str = 'gregorian'):
+        """
+        Return the date fields of the first matching row without building a DataFrame.
         
-        return result, first_index, span
+        Returns
+        -------
+        DateRow or None
+            Named tuple of g_year, g_month, g_day, h_year, h_month, h_day,
+            or None if nothing matched.
+        """
+        pos = self._match(date_type, year, month, day)
+        if len(pos) == 0:
+            return None
+        return DateRow(*self._rec[pos[0]].tolist())
     
     def get_match_indexes(self, year: int, month: Optional[int], day: Optional[int], date_type: str = 'gregorian'):
         """Get only the indexes and count without loading full data."""
-        dtype = self.get_dtype(year, month, day)
-        
-        if date_type == 'gregorian':
-            year_col, month_col, day_col = 'g_year', 'g_month', 'g_day'
-        else:  # hijri
-            year_col, month_col, day_col = 'h_year', 'h_month', 'h_day'
+        match = self._g_match if date_type == 'gregorian' else self._h_match
+        pos = match(year, month, day)
         
-        if dtype == "date":
-            mask = ((self.df[year_col] == year) & 
-                    (self.df[month_col] == month) & 
-                    (self.df[day_col] == day))
-        elif dtype == "month_range":
-            mask = ((self.df[year_col] == year) & 
-                    (self.df[month_col] == month))
-        elif dtype == "year_range":
-            mask = (self.df[year_col] == year)
-        else:
+        if len(pos) == 0:
             return None, None, 0
+        else:
+            labels = self._labels
+            return labels[pos[0]], labels[pos[-1]], len(pos)
+    
+    def get_match_indexes_many(self, years, months=None, days=None, date_type: str = 'gregorian'):
+        """
+        Vectorized get_match_indexes for many queries of the same precision.
         
-        matching_indexes = self.df.index[mask]
+        Pass ``days`` (and ``months``) for exact dates, only ``months`` for
+        month ranges, or just ``years`` for year ranges.
         
-        if len(matching_indexes) == 0:
-            return None, None, 0
+        Returns
+        -------
+        pd.DataFrame
+            One row per query with columns first_index, last_index and count;
+            first_index and last_index are None where nothing matched.
+        """
+        sorted_key, order = self._g_keys if date_type == 'gregorian' else self._h_keys
+        years = np.asarray(years, dtype=np.int64)
+        months = None if months is None else np.asarray(months, dtype=np.int64)
+        days = None if days is None else np.asarray(days, dtype=np.int64)
+        
+        if order is not None:
+            # Matches are not contiguous in row order; answer query by query
+            queries = zip(years.tolist(),
+                          [None] * len(years) if months is None else months.tolist(),
+                          [None] * len(years) if days is None else days.tolist())
+            rows = [self.get_match_indexes(y, m, d, date_type) for y, m, d in queries]
+            return self._pd.DataFrame(rows, columns=['first_index', 'last_index', 'count'])
+        
+        # Same key ranges as _search_positions, computed for every query at once
+        valid = (years >= 0) & (years < 1 << 13)
+        lo_key = years << 18
+        if months is None:
+            hi_key = lo_key | 0x3FFFF
         else:
-            return matching_indexes[0], matching_indexes[-1], len(matching_indexes)
+            valid &= (months >= 0) & (months < 1 << 13)
+            lo_key = lo_key | (months << 5)
+            if days is None:
+                hi_key = lo_key | 0x1F
+            else:
+                valid &= (days >= 0) & (days < 1 << 5)
+                lo_key = hi_key = lo_key | days
+        lo_key = np.where(valid, lo_key, 0).astype(np.int32)
+        hi_key = np.where(valid, hi_key, 0).astype(np.int32)
+        
+        lo = np.searchsorted(sorted_key, lo_key, 'left')
+        hi = np.searchsorted(sorted_key, hi_key, 'right')
+        count = np.where(valid, hi - lo, 0)
+        hit = count > 0
+        first_index = np.full(len(years), None, dtype=object)
+        last_index = np.full(len(years), None, dtype=object)
+        first_index[hit] = self._labels[lo[hit]]
+        last_index[hit] = self._labels[hi[hit] - 1]
+        return self._pd.DataFrame({'first_index': first_index, 'last_index': last_index, 'count': count})
+
+    
+    def _convert_many(self, key_index, years, months, days):
+        """Resolve many exact dates against one calendar's key index."""
+        distinct, first_rows = key_index
+        years = np.asarray(years, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+        # Values outside the packed bit widths would alias a neighbouring key
+        valid = ((years >= 0) & (years < 1 << 13) & (months >= 0) & (months < 1 << 13)
+                 & (days >= 0) & (days < 1 << 5))
+        hits = distinct.get_indexer(_pack_key(years, months, days))
+        missing = ~valid | (hits == -1)
+        return self.df.take(first_rows[hits[~missing]]), missing
+    
+    def to_hijri_many(self, years, months, days):
+        """
+        Convert many Gregorian dates to Hijri in a single hash lookup.
+        
+        Returns
+        -------
+        tuple
+            (result_df, missing) where:
+            - result_df: pd.DataFrame with the first matching row of every
+              found date, in query order
+            - missing: np.ndarray of bool, True for queries with no match
+        """
+        return self._convert_many(self._g_key_index, years, months, days)
+    
+    def to_greg_many(self, years, months, days):
+        """
+        Convert many Hijri dates to Gregorian in a single hash lookup.
+        
+        Returns
+        -------
+        tuple
+            (result_df, missing) where:
+            - result_df: pd.DataFrame with the first matching row of every
+              found date, in query order
+            - missing: np.ndarray of bool, True for queries with no match
+        """
+        return self._convert_many(self._h_key_index, years, months, days)
 
 
 def demonstrate_hijri_system():
@@ -160,6 +447,7 @@ def demonstrate_hijri_system():
     
     # Initialize the mapper
     mapper = HijriDateMapper()
+    mapper.describe()
     print()
     
     print("📅 BASIC HIJRI DATE OPERATIONS")
@@ -254,8 +542,9 @@ def demonstrate_hijri_system():
     result_df, first_idx, span = mapper.to_hijri(greg_year, greg_month, greg_day)
     
     if not result_df.empty:
-        row = result_df.iloc[0]
-        hijri_date = idate(row['h_year'], row['h_month'], row['h_day'])
+        # first_row yields plain ints; the frame's int16 years would overflow in arithmetic
+        row = mapper.first_row(greg_year, greg_month, greg_day)
+        hijri_date = idate(row.h_year, row.h_month, row.h_day)
         print(f"   Gregorian {greg_year}-{greg_month:02d}-{greg_day:02d}")
         print(f"   → Hijri {hijri_date}")
         print(f"   → Index: {first_idx}, Span: {span}")
@@ -384,9 +673,8 @@ def demonstrate_hijri_system():
     
     # Create many dates
     start_time = time.time()
-    dates = [idate(1447, month, day) 
-             for month in range(1, 13) 
-             for day in range(1, 31)]
+    months, days = np.meshgrid(np.arange(1, 13), np.arange(1, 31), indexing='ij')
+    dates = HijriDate.from_arrays(1447, months.ravel(), days.ravel())
     creation_time = time.time() - start_time
     
     print(f"    Created {len(dates)} dates in {creation_time:.4f} seconds")
@@ -410,29 +698,32 @@ def demonstrate_hijri_system():
     print("-" * 40)
     
     print("16. Integration with pandas:")
+    import pandas as pd
     # Create a pandas Series with HijriDates
     hijri_dates = [idate(1447, 6, day) for day in range(1, 11)]
+    days = np.fromiter((d.day for d in hijri_dates), dtype=np.int8, count=len(hijri_dates))
+    weekday = days % 7
     df = pd.DataFrame({
         'hijri_date': hijri_dates,
         'event': [f'Day {i}' for i in range(1, 11)],
-        'is_weekend': [(d.day % 7 in [5, 6]) for d in hijri_dates]  # Example logic
+        'is_weekend': (weekday == 5) | (weekday == 6)  # Example logic
     })
     
     print("    Sample DataFrame with HijriDates:")
     print(df.head())
     
-    # Filter dates
-    filtered = df[df['hijri_date'] >= idate(1447, 6, 5)]
+    # Filter dates on integer ordinals rather than comparing HijriDate objects
+    ordinals = np.fromiter((d._to_ordinal() for d in hijri_dates), dtype=np.int64, count=len(hijri_dates))
+    filtered = df[ordinals >= idate(1447, 6, 5)._to_ordinal()]
     print(f"    Filtered to {len(filtered)} dates >= 1447-06-05")
     print()
     
     print("17. Custom date ranges:")
     def hijri_date_range(start_date, end_date, step_days=1):
         """Generate a range of HijriDates."""
-        current = start_date
-        while current <= end_date:
-            yield current
-            current = current + iTimedelta(days=step_days)
+        count = max((end_date - start_date).days // step_days + 1, 0)
+        offsets = np.arange(count, dtype=np.int64) * step_days
+        return HijriDate.from_ordinals(start_date._to_ordinal() + offsets)
     
     start = idate(1447, 6, 1)
     end = idate(1447, 6, 10)
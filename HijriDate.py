@@ -8,18 +8,61 @@ datetime.date and datetime.timedelta, along with a flexible idate() factory func
 from typing import Union, Tuple, Optional
 import functools
 
+import numpy as np
+
+
+def ordinals_to_ymd(ordinals) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Convert an array of ordinals to Hijri (year, month, day) arrays.
+    
+    Vectorized counterpart of HijriDate._from_ordinal.
+    
+    Args:
+        ordinals (array_like): Days since Hijri year 1
+        
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: Years, months (1-12) and days (1-30)
+    """
+    years, remaining = np.divmod(np.asarray(ordinals, dtype=np.int64), 354)
+    months, days = np.divmod(remaining, 30)
+    return years + 1, months + 1, days + 1
+
+
+def ymd_to_ordinals(years, months, days) -> np.ndarray:
+    """
+    Convert Hijri (year, month, day) arrays to ordinals.
+    
+    Vectorized counterpart of HijriDate._to_ordinal.
+    
+    Args:
+        years (array_like): Hijri years
+        months (array_like): Hijri months (1-12)
+        days (array_like): Hijri days (1-30)
+        
+    Returns:
+        np.ndarray: Days since Hijri year 1
+    """
+    years = np.asarray(years, dtype=np.int64)
+    months = np.asarray(months, dtype=np.int64)
+    days = np.asarray(days, dtype=np.int64)
+    return (years - 1) * 354 + (months - 1) * 30 + (days - 1)
+
 
-@functools.total_ordering
 class HijriDate:
     """
     A Hijri date representation similar to datetime.date.
     
     Attributes:
-        year (int): Hijri year
-        month (int): Hijri month (1-12)
-        day (int): Hijri day (1-30)
+        year (int): Hijri year (read-only)
+        month (int): Hijri month (1-12, read-only)
+        day (int): Hijri day (1-30, read-only)
     """
     
+    # The date fields are private and exposed read-only, like datetime.date,
+    # so neither cached value derived from them can go stale: the packed
+    # comparison key (_key, see _cmp_key) and the isoformat string (_iso_cache)
+    __slots__ = ('_year', '_month', '_day', '_key', '_iso_cache')
+    
     def __init__(self, year: int, month: int, day: int):
         """
         Initialize a HijriDate object.
@@ -37,33 +80,149 @@ class HijriDate:
         if not (1 <= day <= 30):
             raise ValueError(f"Day must be between 1 and 30, got {day}")
             
-        self.year = year
-        self.month = month
-        self.day = day
+        self._year = year
+        self._month = month
+        self._day = day
+        self._key = None
+        self._iso_cache = None
+    
+    @property
+    def year(self) -> int:
+        """Hijri year."""
+        return self._year
+    
+    @property
+    def month(self) -> int:
+        """Hijri month (1-12)."""
+        return self._month
+    
+    @property
+    def day(self) -> int:
+        """Hijri day (1-30)."""
+        return self._day
+    
+    @classmethod
+    def _unchecked(cls, year: int, month: int, day: int) -> 'HijriDate':
+        """Create a HijriDate from components already known to be in range, skipping validation."""
+        self = cls.__new__(cls)
+        self._year = year
+        self._month = month
+        self._day = day
+        self._key = None
+        self._iso_cache = None
+        return self
+    
+    @classmethod
+    def from_arrays(cls, years, months, days) -> np.ndarray:
+        """
+        Create many HijriDate objects at once.
+        
+        Month and day ranges are validated once for the whole batch instead
+        of once per date.
+        
+        Args:
+            years (array_like): Hijri years
+            months (array_like): Hijri months (1-12)
+            days (array_like): Hijri days (1-30)
+            
+        Returns:
+            np.ndarray: Object array of HijriDate with the broadcast shape of the inputs
+            
+        Raises:
+            ValueError: If any month or day value is out of valid range
+        """
+        years, months, days = np.broadcast_arrays(years, months, days)
+        if not np.all((months >= 1) & (months <= 12)):
+            raise ValueError(f"Month must be between 1 and 12, got {months[(months < 1) | (months > 12)][0]}")
+        if not np.all((days >= 1) & (days <= 30)):
+            raise ValueError(f"Day must be between 1 and 30, got {days[(days < 1) | (days > 30)][0]}")
+        
+        dates = np.empty(years.shape, dtype=object)
+        flat = dates.reshape(-1)
+        unchecked = cls._unchecked
+        for i, (year, month, day) in enumerate(zip(years.ravel().tolist(),
+                                                   months.ravel().tolist(),
+                                                   days.ravel().tolist())):
+            # Already validated above, so skip __init__
+            flat[i] = unchecked(year, month, day)
+        return dates
+    
+    @classmethod
+    def from_ordinals(cls, ordinals) -> np.ndarray:
+        """
+        Create many HijriDate objects from ordinals in one vectorized conversion.
+        
+        Args:
+            ordinals (array_like): Days since Hijri year 1
+            
+        Returns:
+            np.ndarray: Object array of HijriDate with the shape of ``ordinals``
+        """
+        return cls.from_arrays(*ordinals_to_ymd(ordinals))
     
     def __repr__(self) -> str:
         """Return string representation of HijriDate."""
-        return f"HijriDate({self.year}, {self.month}, {self.day})"
+        return f"HijriDate({self._year}, {self._month}, {self._day})"
     
     def __str__(self) -> str:
         """Return human-readable string representation."""
-        return f"{self.year:04d}-{self.month:02d}-{self.day:02d}"
+        return self.isoformat()
+    
+    def __reduce__(self):
+        """Pickle as a constructor call, without the slot state."""
+        return (type(self), (self._year, self._month, self._day))
+    
+    def _cmp_key(self) -> int:
+        """
+        Return (year, month, day) packed into one int that orders like the tuple.
+        
+        Computed on first use and cached, so comparisons are a single int compare.
+        """
+        key = self._key
+        if key is None:
+            # int() guards against narrow numpy ints overflowing the shifts
+            key = self._key = (int(self._year) << 14) | (int(self._month) << 5) | int(self._day)
+        return key
     
     def __eq__(self, other) -> bool:
         """Check equality with another HijriDate."""
         if not isinstance(other, HijriDate):
             return NotImplemented
-        return (self.year, self.month, self.day) == (other.year, other.month, other.day)
+        return self._cmp_key() == other._cmp_key()
     
     def __lt__(self, other) -> bool:
         """Check if this date is less than another HijriDate."""
         if not isinstance(other, HijriDate):
             return NotImplemented
-        return (self.year, self.month, self.day) < (other.year, other.month, other.day)
+        return self._cmp_key() < other._cmp_key()
+    
+    def __ne__(self, other) -> bool:
+        """Check inequality with another HijriDate."""
+        if not isinstance(other, HijriDate):
+            return NotImplemented
+        return self._cmp_key() != other._cmp_key()
+    
+    def __le__(self, other) -> bool:
+        """Check if this date is less than or equal to another HijriDate."""
+        if not isinstance(other, HijriDate):
+            return NotImplemented
+        return self._cmp_key() <= other._cmp_key()
+    
+    def __gt__(self, other) -> bool:
+        """Check if this date is greater than another HijriDate."""
+        if not isinstance(other, HijriDate):
+            return NotImplemented
+        return self._cmp_key() > other._cmp_key()
+    
+    def __ge__(self, other) -> bool:
+        """Check if this date is greater than or equal to another HijriDate."""
+        if not isinstance(other, HijriDate):
+            return NotImplemented
+        return self._cmp_key() >= other._cmp_key()
     
     def __hash__(self) -> int:
         """Return hash value for use in sets and dictionaries."""
-        return hash((self.year, self.month, self.day))
+        return hash((self._year, self._month, self._day))
     
     def __add__(self, other) -> 'HijriDate':
         """
@@ -75,9 +234,13 @@ class HijriDate:
         Returns:
             HijriDate: New date after adding the timedelta
         """
-        if not isinstance(other, iTimedelta):
+        # Exact-type check first; isinstance only runs for subclasses/others
+        if type(other) is not iTimedelta and not isinstance(other, iTimedelta):
             return NotImplemented
-        return self._add_days(other.days)
+        # _add_days inlined to save a call frame per addition
+        return self._from_ordinal(
+            self._year * 354 + self._month * 30 + self._day - 385 + other._days
+        )
     
     def __sub__(self, other) -> Union['HijriDate', 'iTimedelta']:
         """
@@ -90,10 +253,15 @@ class HijriDate:
             HijriDate: If subtracting timedelta, returns new date
             iTimedelta: If subtracting HijriDate, returns difference in days
         """
-        if isinstance(other, iTimedelta):
-            return self._add_days(-other.days)
-        elif isinstance(other, HijriDate):
-            days_diff = self._to_ordinal() - other._to_ordinal()
+        if type(other) is iTimedelta or isinstance(other, iTimedelta):
+            return self._from_ordinal(
+                self._year * 354 + self._month * 30 + self._day - 385 - other._days
+            )
+        elif type(other) is HijriDate or isinstance(other, HijriDate):
+            # Difference of ordinals; the epoch offset cancels out
+            days_diff = ((self._year - other._year) * 354
+                         + (self._month - other._month) * 30
+                         + (self._day - other._day))
             return iTimedelta(days=days_diff)
         return NotImplemented
     
@@ -108,8 +276,8 @@ class HijriDate:
         Returns:
             int: Days since Hijri year 1
         """
-        # Simple calculation: (year-1)*354 + (month-1)*30 + (day-1)
-        return (self.year - 1) * 354 + (self.month - 1) * 30 + (self.day - 1)
+        # (year-1)*354 + (month-1)*30 + (day-1), with the constants folded into -385
+        return self._year * 354 + self._month * 30 + self._day - 385
     
     @classmethod
     def _from_ordinal(cls, ordinal: int) -> 'HijriDate':
@@ -122,24 +290,17 @@ class HijriDate:
         Returns:
             HijriDate: Corresponding Hijri date
         """
-        # Reverse calculation
-        year = ordinal // 354 + 1
-        remaining = ordinal % 354
-        month = remaining // 30 + 1
-        day = remaining % 30 + 1
-        
-        # Handle edge cases for month/day overflow
-        if month > 12:
-            year += 1
-            month = 1
-        if day > 30:
-            month += 1
-            day = 1
-            if month > 12:
-                year += 1
-                month = 1
-        
-        return cls(year, month, day)
+        # Reverse calculation; remaining < 354 keeps month <= 12 and day <= 30
+        years, remaining = divmod(ordinal, 354)
+        months, days = divmod(remaining, 30)
+        # Same as _unchecked, inlined: this runs for every arithmetic result
+        self = cls.__new__(cls)
+        self._year = years + 1
+        self._month = months + 1
+        self._day = days + 1
+        self._key = None
+        self._iso_cache = None
+        return self
     
     def _add_days(self, days: int) -> 'HijriDate':
         """
@@ -155,19 +316,40 @@ class HijriDate:
         return self._from_ordinal(ordinal)
     
     def isoformat(self) -> str:
-        """Return date in ISO-like format (YYYY-MM-DD)."""
-        return f"{self.year:04d}-{self.month:02d}-{self.day:02d}"
+        """Return date in ISO-like format (YYYY-MM-DD), formatted once per date."""
+        iso = self._iso_cache
+        if iso is None:
+            year, month, day = self._year, self._month, self._day
+            iso = self._iso_cache = f"{year:04d}-{month:02d}-{day:02d}"
+        return iso
 
 
-@functools.total_ordering
 class iTimedelta:
     """
     A time duration representation similar to datetime.timedelta.
     
     Attributes:
-        days (int): Number of days in the duration
+        days (int): Number of days in the duration (read-only)
     """
     
+    # days is exposed read-only: small values are shared instances (see
+    # _SMALL_TD_CACHE) and idate() caches its results, so a public setter
+    # would let one caller change every other caller's duration
+    __slots__ = ('_days',)
+    
+    def __new__(cls, days: Optional[int] = None):
+        """
+        Return the shared instance for common small durations.
+        
+        Calls without an argument (as made by copy and pickle) always get a
+        fresh object, so restoring state never touches a shared instance.
+        """
+        if type(days) is int and cls is iTimedelta:
+            cached = _SMALL_TD_CACHE.get(days)
+            if cached is not None:
+                return cached
+        return super().__new__(cls)
+    
     def __init__(self, days: int = 0):
         """
         Initialize an iTimedelta object.
@@ -175,36 +357,69 @@ class iTimedelta:
         Args:
             days (int): Number of days (can be negative)
         """
-        self.days = days
+        self._days = days
+    
+    @property
+    def days(self) -> int:
+        """Number of days in the duration."""
+        return self._days
     
     def __repr__(self) -> str:
         """Return string representation of iTimedelta."""
-        return f"iTimedelta(days={self.days})"
+        return f"iTimedelta(days={self._days})"
     
     def __str__(self) -> str:
         """Return human-readable string representation."""
-        if self.days == 1:
+        if self._days == 1:
             return "1 day"
-        elif self.days == -1:
+        elif self._days == -1:
             return "-1 day"
         else:
-            return f"{self.days} days"
+            return f"{self._days} days"
+    
+    def __reduce__(self):
+        """Pickle as a constructor call; small values load as the shared instances."""
+        return (type(self), (self._days,))
     
     def __eq__(self, other) -> bool:
         """Check equality with another iTimedelta."""
         if not isinstance(other, iTimedelta):
             return NotImplemented
-        return self.days == other.days
+        return self._days == other._days
     
     def __lt__(self, other) -> bool:
         """Check if this duration is less than another iTimedelta."""
         if not isinstance(other, iTimedelta):
             return NotImplemented
-        return self.days < other.days
+        return self._days < other._days
+    
+    def __ne__(self, other) -> bool:
+        """Check inequality with another iTimedelta."""
+        if not isinstance(other, iTimedelta):
+            return NotImplemented
+        return self._days != other._days
+    
+    def __le__(self, other) -> bool:
+        """Check if this duration is less than or equal to another iTimedelta."""
+        if not isinstance(other, iTimedelta):
+            return NotImplemented
+        return self._days <= other._days
+    
+    def __gt__(self, other) -> bool:
+        """Check if this duration is greater than another iTimedelta."""
+        if not isinstance(other, iTimedelta):
+            return NotImplemented
+        return self._days > other._days
+    
+    def __ge__(self, other) -> bool:
+        """Check if this duration is greater than or equal to another iTimedelta."""
+        if not isinstance(other, iTimedelta):
+            return NotImplemented
+        return self._days >= other._days
     
     def __hash__(self) -> int:
         """Return hash value for use in sets and dictionaries."""
-        return hash(self.days)
+        return hash(self._days)
     
     def __add__(self, other) -> Union['iTimedelta', 'HijriDate']:
         """
@@ -217,9 +432,9 @@ class iTimedelta:
             iTimedelta: If adding timedelta, returns combined duration
             HijriDate: If adding to HijriDate, returns new date
         """
-        if isinstance(other, iTimedelta):
-            return iTimedelta(days=self.days + other.days)
-        elif isinstance(other, HijriDate):
+        if type(other) is iTimedelta or isinstance(other, iTimedelta):
+            return iTimedelta(days=self._days + other._days)
+        elif type(other) is HijriDate or isinstance(other, HijriDate):
             return other + self
         return NotImplemented
     
@@ -233,9 +448,41 @@ class iTimedelta:
         Returns:
             iTimedelta: Resulting duration
         """
-        if not isinstance(other, iTimedelta):
+        if type(other) is not iTimedelta and not isinstance(other, iTimedelta):
             return NotImplemented
-        return iTimedelta(days=self.days - other.days)
+        return iTimedelta(days=self._days - other._days)
+    
+    def __iadd__(self, other) -> 'iTimedelta':
+        """
+        Add another timedelta, as ``+`` does.
+        
+        iTimedelta is a hashable value, so ``+=`` never mutates it: the name
+        is rebound to a new (or shared small-value) object, and other
+        references, set members and dict keys keep their value.
+        
+        Args:
+            other (iTimedelta): Timedelta to add
+            
+        Returns:
+            iTimedelta: A new timedelta holding the sum
+        """
+        if type(other) is not iTimedelta and not isinstance(other, iTimedelta):
+            return NotImplemented
+        return iTimedelta(days=self._days + other._days)
+    
+    def __isub__(self, other) -> 'iTimedelta':
+        """
+        Subtract another timedelta, as ``-`` does; never mutates (see ``__iadd__``).
+        
+        Args:
+            other (iTimedelta): Timedelta to subtract
+            
+        Returns:
+            iTimedelta: A new timedelta holding the difference
+        """
+        if type(other) is not iTimedelta and not isinstance(other, iTimedelta):
+            return NotImplemented
+        return iTimedelta(days=self._days - other._days)
     
     def __mul__(self, other) -> 'iTimedelta':
         """
@@ -247,8 +494,8 @@ class iTimedelta:
         Returns:
             iTimedelta: Multiplied duration
         """
-        if isinstance(other, (int, float)):
-            return iTimedelta(days=int(self.days * other))
+        if type(other) is int or type(other) is float or isinstance(other, (int, float)):
+            return iTimedelta(days=int(self._days * other))
         return NotImplemented
     
     def __rmul__(self, other) -> 'iTimedelta':
@@ -266,33 +513,44 @@ class iTimedelta:
             iTimedelta: If dividing by scalar, returns new duration
             float: If dividing by timedelta, returns ratio
         """
-        if isinstance(other, (int, float)):
-            return iTimedelta(days=int(self.days / other))
-        elif isinstance(other, iTimedelta):
-            if other.days == 0:
+        if type(other) is int:
+            # Integer path: same truncation toward zero as int(days / other),
+            # without the float round-trip
+            days = self._days
+            quotient = abs(days) // abs(other)
+            return iTimedelta(days=quotient if (days < 0) == (other < 0) else -quotient)
+        elif type(other) is float or isinstance(other, (int, float)):
+            return iTimedelta(days=int(self._days / other))
+        elif type(other) is iTimedelta or isinstance(other, iTimedelta):
+            if other._days == 0:
                 raise ZeroDivisionError("Cannot divide by zero timedelta")
-            return self.days / other.days
+            return self._days / other._days
         return NotImplemented
     
     def __neg__(self) -> 'iTimedelta':
         """Return negative duration."""
-        return iTimedelta(days=-self.days)
+        return iTimedelta(days=-self._days)
     
     def __pos__(self) -> 'iTimedelta':
         """Return positive duration (copy)."""
-        return iTimedelta(days=self.days)
+        return iTimedelta(days=self._days)
     
     def __abs__(self) -> 'iTimedelta':
         """Return absolute duration."""
-        return iTimedelta(days=abs(self.days))
+        return iTimedelta(days=abs(self._days))
     
     def __bool__(self) -> bool:
         """Return True if duration is non-zero."""
-        return self.days != 0
+        return self._days != 0
     
     def total_days(self) -> int:
         """Return total number of days (for compatibility)."""
-        return self.days
+        return self._days
+
+
+# Flyweight instances for the durations date arithmetic creates most often
+_SMALL_TD_CACHE = {}
+_SMALL_TD_CACHE.update((days, iTimedelta(days)) for days in (*range(-256, 257), 354, -354))
 
 
 def idate(year: int, month: Optional[int] = None, day: Optional[int] = None) -> Union[HijriDate, Tuple[HijriDate, iTimedelta]]:
@@ -323,24 +581,49 @@ def idate(year: int, month: Optional[int] = None, day: Optional[int] = None) ->
         >>> start, duration = idate(1447)
         >>> print(start, duration)
         HijriDate(1447, 1, 1) iTimedelta(days=354)
+    
+    Results are cached, so repeated calls with the same arguments return
+    the same objects; both HijriDate and iTimedelta are read-only, so a
+    shared result cannot be changed by one caller.
     """
     if day is not None:
         # Full date specified: return HijriDate
         if month is None:
             raise ValueError("Month must be specified when day is provided")
-        return HijriDate(year, month, day)
+        return _idate_full(year, month, day)
     
     elif month is not None:
         # Year and month specified: return month range
-        start_date = HijriDate(year, month, 1)
-        duration = iTimedelta(days=30)  # Assuming 30 days per month
-        return start_date, duration
+        return _idate_month(year, month)
     
     else:
         # Only year specified: return year range
-        start_date = HijriDate(year, 1, 1)
-        duration = iTimedelta(days=354)  # Assuming 354 days per year
-        return start_date, duration
+        return _idate_year(year)
+
+
+# idate() results are immutable value objects (+= on an iTimedelta returns
+# a new object), so callers can share cached instances;
+# typed=True keeps e.g. int and numpy ints apart
+@functools.lru_cache(maxsize=4096, typed=True)
+def _idate_full(year: int, month: int, day: int) -> HijriDate:
+    """Cached single date for idate(year, month, day)."""
+    return HijriDate(year, month, day)
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _idate_month(year: int, month: int) -> Tuple[HijriDate, iTimedelta]:
+    """Cached month range for idate(year, month)."""
+    start_date = HijriDate(year, month, 1)
+    duration = iTimedelta(days=30)  # Assuming 30 days per month
+    return start_date, duration
+
+
+@functools.lru_cache(maxsize=4096, typed=True)
+def _idate_year(year: int) -> Tuple[HijriDate, iTimedelta]:
+    """Cached year range for idate(year)."""
+    start_date = HijriDate(year, 1, 1)
+    duration = iTimedelta(days=354)  # Assuming 354 days per year
+    return start_date, duration
 
 
 # Example usage and demonstration
@@ -411,5 +694,5 @@ if __name__ == "__main__":
     print("=== Integration with HijriDateMapper (Conceptual) ===")
     print("# This would work with the provided HijriDateMapper class:")
     print("# mapper = HijriDateMapper()")
-    print("# result, first_idx, span = mapper.to_hijri(2024, 1, 15)")
-    print("# hijri_date = idate(result.iloc[0]['h_year'], result.iloc[0]['h_month'], result.iloc[0]['h_day'])")
\ No newline at end of file
+    print("# row = mapper.first_row(2024, 1, 15)")
+    print("# hijri_date = idate(row.h_year, row.h_month, row.h_day)")
\ No newline at end of file
@@ -1,30 +1,68 @@
+import logging
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+def _find_dirs(root, match):
+    """
+    Collect every directory below `root` whose name satisfies `match`.
+    
+    Uses os.scandir over an explicit stack of directories: the dirent type
+    answers is_dir() without an extra stat call, matched directories are not
+    descended into, and deep trees cannot hit the recursion limit.
+    """
+    found = []
+    stack = [root]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as entries:
+                for entry in entries:
+                    if not entry.is_dir(follow_symlinks=False):
+                        continue
+                    if match(entry.name):
+                        found.append(entry.path)
+                    else:
+                        stack.append(entry.path)
+        except OSError as e:
+            # Unreadable or vanished directory; skip it and keep sweeping
+            logger.warning("[SKIPPED] %s -> %s", current, e)
+    return found
+
+def _remove_tree(path):
+    try:
+        shutil.rmtree(path)
+        logger.info("[REMOVED] %s", path)
+    except Exception as e:
+        logger.warning("[ERROR]   %s -> %s", path, e)
+
+def _sweep(root, match):
+    """
+    Remove every directory below `root` whose name satisfies `match`.
+    
+    The matched directories are disjoint subtrees, so they are deleted in
+    parallel to overlap the per-file unlink latency.
+    """
+    victims = _find_dirs(root, match)
+    if not victims:
+        return
+    max_workers = min(32, (os.cpu_count() or 1) * 4, len(victims))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(_remove_tree, victims))
+
+def _is_build_artifact(name):
+    return name == "__pycache__" or name.endswith(".egg-info")
 
 def remove_egg_info_recursively(root="."):
     """
     Recursively remove all directories ending with `.egg-info` starting from `root`.
     """
-    for dirpath, dirnames, _ in os.walk(root):
-        # Make a copy of dirnames because we may modify it while iterating
-        for dirname in dirnames[:]:
-            if dirname.endswith(".egg-info"):
-                full_path = os.path.join(dirpath, dirname)
-                print(f"Removing {full_path}/ ...")
-                shutil.rmtree(full_path)
-                # remove from dirnames so os.walk doesn't descend into it
-                dirnames.remove(dirname)
+    _sweep(root, lambda name: name.endswith(".egg-info"))
 
 def remove_pycache(root_folder):
-    for root, dirs, files in os.walk(root_folder):
-        for d in dirs:
-            if d == "__pycache__":
-                cache_path = os.path.join(root, d)
-                try:
-                    shutil.rmtree(cache_path)
-                    print(f"[REMOVED] {cache_path}")
-                except Exception as e:
-                    print(f"[ERROR]   {cache_path} -> {e}")
+    _sweep(root_folder, lambda name: name == "__pycache__")
 
 def clean_build_dirs():
     """
@@ -34,24 +72,23 @@ def clean_build_dirs():
     """
     # Always check 'dist'
     if os.path.exists("dist"):
-        print("Removing dist/ ...")
+        logger.info("Removing dist/ ...")
         shutil.rmtree("dist")
     else:
-        print("dist/ not found, skipping.")
+        logger.info("dist/ not found, skipping.")
         
     # Always check '.pytest_cache'
     if os.path.exists(".pytest_cache"):
-        print("Removing dist/ ...")
+        logger.info("Removing .pytest_cache/ ...")
         shutil.rmtree(".pytest_cache")
     else:
-        print(".pytest_cache/ not found, skipping.")    
+        logger.info(".pytest_cache/ not found, skipping.")    
     
 
-    remove_egg_info_recursively()
-    
-    folder_to_clean = "."   # current folder, change if needed
-    remove_pycache(folder_to_clean)
+    # *.egg-info and __pycache__ in one traversal of the current folder
+    _sweep(".", _is_build_artifact)
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     clean_build_dirs()
\ No newline at end of file
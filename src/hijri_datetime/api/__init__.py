@@ -1,24 +1,37 @@
-from .aladhan.get.fetch_gregorian_data import fetch_gregorian_data
-from .aladhan.get.fetch_gregorian_month_data import fetch_gregorian_month_data
-from .aladhan.get.fetch_hijri_data import fetch_hijri_data
-from .aladhan.get.fetch_hijri_month_data import fetch_hijri_month_data
+from .aladhan.get.fetch_gregorian_data import fetch_gregorian_data, fetch_gregorian_data_batch
+from .aladhan.get.fetch_gregorian_month_data import fetch_gregorian_month_data, fetch_gregorian_month_data_batch
+from .aladhan.get.fetch_hijri_data import fetch_hijri_data, fetch_hijri_data_batch, fetch_hijri_dates
+from .aladhan.get.fetch_hijri_month_data import (
+    fetch_hijri_month_data,
+    fetch_hijri_month_data_batch,
+    iter_hijri_month_days,
+)
 
 from .aladhan.utils.json_files_dict import json_files_dict
-from .aladhan.utils.process_one_day_date_data import process_one_day_date_data
+from .aladhan.utils.process_one_day_date_data import DateRow, HolidayRow, process_one_day_date_data
 from .aladhan.utils.safe_get import safe_get
 
 
 from .aladhan.get_api_day_data import get_api_day_data
-from .aladhan.get_api_month_data import get_api_month_data
+from .aladhan.get_api_month_data import get_api_month_data, get_api_month_dataframe
 
 __all__ = [
     "fetch_gregorian_data",
+    "fetch_gregorian_data_batch",
     "fetch_gregorian_month_data",
+    "fetch_gregorian_month_data_batch",
     "fetch_hijri_data",
+    "fetch_hijri_data_batch",
+    "fetch_hijri_dates",
     "fetch_hijri_month_data",
+    "fetch_hijri_month_data_batch",
+    "iter_hijri_month_days",
     "json_files_dict",
     "process_one_day_date_data",
+    "DateRow",
+    "HolidayRow",
     "safe_get",
     "get_api_day_data",
-    "get_api_month_data"
+    "get_api_month_data",
+    "get_api_month_dataframe",
 ]
\ No newline at end of file
@@ -0,0 +1,354 @@
+"""
+Shared HTTP helpers for the Aladhan API fetchers.
+
+The single-call ``fetch_*`` functions are synchronous and share one
+``requests.Session``, so after the first call the HTTPS connection to
+api.aladhan.com is kept alive instead of re-doing the TCP/TLS handshake.
+
+Batches take a concurrent path: every URL of a batch is requested over one
+``aiohttp.ClientSession``, so N lookups cost roughly one round trip of wall
+time instead of N. Without aiohttp (or from inside a running event loop) the
+batch is spread over a thread pool on the shared session instead, which
+overlaps the round trips just as well for typical batch sizes.
+
+The conversion and calendar endpoints are pure functions of their URL, so
+successful responses are cached in memory. A disk layer (one gzip-compressed
+JSON file per URL) is off by default; set ``HIJRI_DATETIME_CACHE_DIR``, or
+assign ``CACHE_DIR``, to a directory such as ``~/.cache/hijri_datetime/aladhan``
+to enable it. The cache keeps raw response bodies, so every hit is parsed
+into a fresh object that the caller may modify.
+
+Requirements
+------------
+- requests
+- aiohttp (optional, for the ``*_batch`` functions; falls back to threads)
+- orjson (optional, faster JSON parsing; falls back to the json module)
+"""
+
+import asyncio
+import gzip
+import hashlib
+import logging
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+
+logger = logging.getLogger(__name__)
+
+# (connect, read) timeouts in seconds for synchronous requests
+REQUEST_TIMEOUT = (3.05, 10)
+
+# DD-MM-YYYY dates and MM-YYYY months, checked before any request is sent
+_DATE_RE = re.compile(r"(0?[1-9]|[12]\d|3[01])-(0?[1-9]|1[0-2])-\d{1,4}")
+_MONTH_RE = re.compile(r"(0?[1-9]|1[0-2])-\d{1,4}")
+
+
+# Directory of the on-disk response cache; empty (the default) disables the disk layer
+CACHE_DIR = os.environ.get('HIJRI_DATETIME_CACHE_DIR', '')
+
+# In-memory layer of raw response bodies in front of the disk cache, evicted oldest-first
+_MEMORY_CACHE_SIZE = 4096
+_MEMORY_CACHE = {}
+
+
+# Connection pool limits for batch fetches
+_CONNECTION_LIMIT = 32
+_CONNECTION_LIMIT_PER_HOST = 16
+
+# Worker threads for batch fetches when aiohttp cannot be used
+_THREAD_WORKERS = 16
+
+
+def _make_session():
+    """Create the shared session with a small connection pool and retries on gateway errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+# Shared keep-alive session used by all synchronous fetch_* functions
+_SESSION = _make_session()
+
+# Bound once so the per-call path does plain global lookups, not attribute chains
+_session_get = _SESSION.get
+RequestException = requests.exceptions.RequestException
+
+
+def _cache_path(url):
+    """Return the disk cache file for a URL."""
+    return os.path.join(CACHE_DIR, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json.gz')
+
+
+def _remember(url, body):
+    """Store a raw response body in the in-memory layer."""
+    if len(_MEMORY_CACHE) >= _MEMORY_CACHE_SIZE:
+        _MEMORY_CACHE.pop(next(iter(_MEMORY_CACHE)), None)
+    _MEMORY_CACHE[url] = body
+
+
+def cache_get(url):
+    """
+    Look up a cached API response, checking memory first and then disk.
+
+    Parameters
+    ----------
+    url : str
+        Full API URL
+
+    Returns
+    -------
+    dict or None
+        A freshly parsed copy of the cached response, or None on a miss.
+    """
+    body = _MEMORY_CACHE.get(url)
+    if body is not None:
+        return json_loads(body)
+    if not CACHE_DIR:
+        return None
+    try:
+        with open(_cache_path(url), 'rb') as f:
+            body = gzip.decompress(f.read())
+        data = json_loads(body)
+    except (OSError, EOFError, ValueError):
+        # Missing, truncated or unreadable entry; treat as a miss
+        return None
+    _remember(url, body)
+    return data
+
+
+def cache_put(url, body, data):
+    """
+    Cache a successful API response in memory and on disk.
+
+    Parameters
+    ----------
+    url : str
+        Full API URL
+    body : bytes
+        Raw response body, kept in memory and written to disk gzip-compressed
+    data : dict
+        Parsed response body, checked for success; the caller keeps it
+    """
+    # Only successful payloads are idempotent; errors may be transient
+    if not isinstance(data, dict) or data.get('code') != 200:
+        return
+    _remember(url, body)
+    if not CACHE_DIR:
+        return
+    path = _cache_path(url)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            # Level 1: repeated JSON keys still compress several-fold at little CPU cost
+            f.write(gzip.compress(body, 1))
+        # Atomic rename so concurrent readers never see a partial file
+        os.replace(tmp_path, path)
+    except OSError:
+        # The disk layer is best-effort; the memory layer already has the entry
+        pass
+
+
+def is_date_str(value):
+    """Return True if `value` is a DD-MM-YYYY date string the API can accept."""
+    return isinstance(value, str) and _DATE_RE.fullmatch(value) is not None
+
+
+def is_month_str(value):
+    """Return True if `value` is an MM-YYYY month string the API can accept."""
+    return isinstance(value, str) and _MONTH_RE.fullmatch(value) is not None
+
+
+def is_month_year(month, year):
+    """Return True if `month`/`year` form a valid month number and positive year."""
+    try:
+        return 1 <= int(month) <= 12 and int(year) > 0
+    except (TypeError, ValueError):
+        return False
+
+
+def _report_invalid(label):
+    """Report input rejected locally, in the same form as a failed request."""
+    logger.warning("Error fetching data for %s: invalid input, request not sent", label)
+
+
+def get_json(url, label, headers=None):
+    """
+    Fetch one API URL synchronously, going through the response cache.
+
+    Parameters
+    ----------
+    url : str or None
+        Full API URL, or None if the caller rejected the input as malformed
+    label : str
+        Identifier used in the error message (e.g. the date string)
+    headers : dict, optional
+        Extra request headers
+
+    Returns
+    -------
+    dict or None
+        Parsed JSON response, or None if the input was rejected, the
+        request failed or the body was not valid JSON.
+    """
+    if url is None:
+        _report_invalid(label)
+        return None
+
+    # Serve repeated lookups from the response cache
+    cached = cache_get(url)
+    if cached is not None:
+        return cached
+
+    try:
+        response = _session_get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+
+        # Raise HTTPError for bad responses (4xx, 5xx)
+        response.raise_for_status()
+
+        # Parse JSON data and cache it for repeated lookups
+        data = json_loads(response.content)
+        cache_put(url, response.content, data)
+        return data
+
+    except (RequestException, ValueError) as e:
+        # Handle all requests-related exceptions (network, HTTP errors, etc.)
+        # and malformed JSON bodies
+        logger.warning("Error fetching data for %s: %s", label, e)
+        return None
+
+
+async def _fetch_json_async(session, slots, url, label):
+    """
+    Fetch one URL on an open session and return the parsed JSON.
+
+    Parameters
+    ----------
+    session : aiohttp.ClientSession
+        Open session to issue the request on
+    slots : asyncio.Semaphore
+        Limits requests in flight, so no request waits for a pooled
+        connection while its timeout is running
+    url : str
+        Full API URL
+    label : str
+        Identifier used in the error message (e.g. the date string)
+
+    Returns
+    -------
+    dict or None
+        Parsed JSON response, or None if the request failed.
+    """
+    import aiohttp
+
+    try:
+        async with slots, session.get(url, headers={'accept': 'application/json'}) as response:
+            # Raise ClientResponseError for bad responses (4xx, 5xx)
+            response.raise_for_status()
+            body = await response.read()
+            data = json_loads(body)
+            cache_put(url, body, data)
+            return data
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        logger.warning("Error fetching data for %s: %s", label, e)
+        return None
+
+
+async def _fetch_json_many_async(urls, labels):
+    """Fetch all URLs concurrently over one session, preserving input order."""
+    import aiohttp
+
+    connector = aiohttp.TCPConnector(limit=_CONNECTION_LIMIT,
+                                     limit_per_host=_CONNECTION_LIMIT_PER_HOST)
+    # Same limits as the synchronous path: connect and read as in
+    # REQUEST_TIMEOUT, and their sum for the whole of each request
+    connect, read = REQUEST_TIMEOUT
+    timeout = aiohttp.ClientTimeout(total=connect + read, connect=connect, sock_read=read)
+    # Every URL goes to the same host, so this matches the per-host pool limit
+    slots = asyncio.Semaphore(_CONNECTION_LIMIT_PER_HOST)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        return await asyncio.gather(*(
+            _fetch_json_async(session, slots, url, label)
+            for url, label in zip(urls, labels)
+        ))
+
+
+def _aiohttp_usable():
+    """Return True if aiohttp is installed and no event loop runs in this thread."""
+    try:
+        import aiohttp  # noqa: F401
+    except ImportError:
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return True
+    return False
+
+
+def _fetch_concurrently(urls, labels):
+    """Fetch URLs concurrently with aiohttp, or with threads as a fallback."""
+    if _aiohttp_usable():
+        return asyncio.run(_fetch_json_many_async(urls, labels))
+    # The GIL is released while waiting on sockets, so threads overlap the round trips
+    with ThreadPoolExecutor(max_workers=min(_THREAD_WORKERS, len(urls))) as executor:
+        return list(executor.map(get_json, urls, labels))
+
+
+def fetch_json_many(urls, labels):
+    """
+    Fetch several API URLs concurrently.
+
+    Parameters
+    ----------
+    urls : list of (str or None)
+        Full API URLs; None marks an input rejected as malformed
+    labels : list of str
+        Identifiers for error messages, one per URL
+
+    Returns
+    -------
+    list of (dict or None)
+        Parsed JSON responses in the same order as ``urls``; rejected
+        inputs and failed requests are None. Cached URLs are not
+        requested again.
+
+    Notes
+    -----
+    Uses aiohttp on a private event loop when possible. Otherwise the
+    requests run on a thread pool over the shared synchronous session;
+    async callers that want the aiohttp path should await
+    ``_fetch_json_many_async`` directly.
+    """
+    urls = list(urls)
+    labels = list(labels)
+    results = [None] * len(urls)
+    missing = []
+    for i, url in enumerate(urls):
+        if url is None:
+            _report_invalid(labels[i])
+            continue
+        results[i] = cache_get(url)
+        if results[i] is None:
+            missing.append(i)
+    if missing:
+        fetched = _fetch_concurrently([urls[i] for i in missing],
+                                      [labels[i] for i in missing])
+        for i, data in zip(missing, fetched):
+            results[i] = data
+    return results
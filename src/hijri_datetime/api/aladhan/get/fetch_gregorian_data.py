@@ -26,11 +26,12 @@ Basic usage examples:
     
     # Error handling is built-in
     invalid_result = fetch_gregorian_data("invalid-date")
-    # Will print error message and return None
+    # Will log a warning and return None
 
 Requirements
 ------------
 - requests
+- aiohttp (optional, speeds up batch fetches)
 
 API Reference
 -------------
@@ -38,7 +39,11 @@ Uses the Aladhan API (https://aladhan.com/hijri-gregorian-calendar-api)
 with HJCoSA (Hijri Calendar of Saudi Arabia) calculation method.
 """
 
-import requests
+from .._http import fetch_json_many, get_json, is_date_str
+
+
+# API URL template, filled with %-formatting on each call
+_URL_FMT = "https://api.aladhan.com/v1/hToG/%s?calendarMethod=HJCoSA"
 
 
 def fetch_gregorian_data(date_str):
@@ -68,7 +73,7 @@ def fetch_gregorian_data(date_str):
     ------
     None
         All exceptions are caught and handled internally.
-        Error messages are printed to console.
+        Errors are logged as warnings via the logging module.
         
     Examples
     --------
@@ -79,24 +84,38 @@ def fetch_gregorian_data(date_str):
     
     >>> # Invalid date handling
     >>> result = fetch_gregorian_data("invalid")
-    Error fetching data for invalid: ...
     >>> print(result)
     None
     """
     # Construct API URL with HJCoSA calculation method (Saudi Arabia standard)
-    url = f"https://api.aladhan.com/v1/hToG/{date_str}?calendarMethod=HJCoSA"
+    # Malformed input is rejected locally instead of costing a round trip
+    url = _URL_FMT % date_str if is_date_str(date_str) else None
     
-    try:
-        # Make HTTP request to Aladhan API
-        response = requests.get(url)
-        
-        # Raise HTTPError for bad responses (4xx, 5xx)
-        response.raise_for_status()
+    # Fetch through the response cache and the shared session; errors yield None
+    return get_json(url, date_str)
+
+
+def fetch_gregorian_data_batch(date_strs):
+    """
+    Convert many Hijri dates to Gregorian with concurrent API requests.
+    
+    Parameters
+    ----------
+    date_strs : iterable of str
+        Hijri dates in DD-MM-YYYY format
         
-        # Return parsed JSON data
-        return response.json()
+    Returns
+    -------
+    list of (dict or None)
+        One response per input date, in input order, with the same
+        structure as ``fetch_gregorian_data``. Failed requests are None.
         
-    except requests.exceptions.RequestException as e:
-        # Handle all requests-related exceptions (network, HTTP errors, etc.)
-        print(f"Error fetching data for {date_str}: {e}")
-        return None
\ No newline at end of file
+    Examples
+    --------
+    >>> results = fetch_gregorian_data_batch(["01-09-1445", "01-10-1445"])
+    >>> [r['data']['gregorian']['date'] for r in results if r]
+    ['11-03-2024', '10-04-2024']
+    """
+    date_strs = list(date_strs)
+    urls = [_URL_FMT % date_str if is_date_str(date_str) else None for date_str in date_strs]
+    return fetch_json_many(urls, date_strs)
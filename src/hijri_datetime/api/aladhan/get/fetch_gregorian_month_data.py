@@ -26,11 +26,12 @@ Basic usage examples:
     
     # Error handling is built-in
     invalid_result = fetch_gregorian_data("invalid-date")
-    # Will print error message and return None
+    # Will log a warning and return None
 
 Requirements
 ------------
 - requests
+- aiohttp (optional, speeds up batch fetches)
 
 API Reference
 -------------
@@ -38,7 +39,11 @@ Uses the Aladhan API (https://aladhan.com/hijri-gregorian-calendar-api)
 with HJCoSA (Hijri Calendar of Saudi Arabia) calculation method.
 """
 
-import requests
+from .._http import fetch_json_many, get_json, is_month_str
+
+
+# API URL template, filled with %-formatting on each call
+_URL_FMT = "https://api.aladhan.com/v1/hToGCalendar/%s?calendarMethod=HJCoSA"
 
 
 def fetch_gregorian_month_data(date_str):
@@ -71,7 +76,7 @@ def fetch_gregorian_month_data(date_str):
     ------
     None
         All exceptions are caught and handled internally.
-        Error messages are printed to console.
+        Errors are logged as warnings via the logging module.
         
     Examples
     --------
@@ -90,24 +95,38 @@ def fetch_gregorian_month_data(date_str):
     
     >>> # Invalid month handling
     >>> result = fetch_gregorian_data("invalid")
-    Error fetching data for invalid: ...
     >>> print(result)
     None
     """
     # Construct API URL using hToGCalendar endpoint with HJCoSA calculation method
-    url = f"https://api.aladhan.com/v1/hToGCalendar/{date_str}?calendarMethod=HJCoSA"
+    # Malformed input is rejected locally instead of costing a round trip
+    url = _URL_FMT % date_str if is_month_str(date_str) else None
     
-    try:
-        # Make HTTP request to Aladhan API calendar endpoint
-        response = requests.get(url)
-        
-        # Raise HTTPError for bad responses (4xx, 5xx)
-        response.raise_for_status()
+    # Fetch through the response cache and the shared session; errors yield None
+    return get_json(url, date_str)
+
+
+def fetch_gregorian_month_data_batch(date_strs):
+    """
+    Fetch several Hijri calendar months with concurrent API requests.
+    
+    Parameters
+    ----------
+    date_strs : iterable of str
+        Hijri months in MM-YYYY format (e.g., "09-1445")
         
-        # Return parsed JSON data containing full month calendar
-        return response.json()
+    Returns
+    -------
+    list of (dict or None)
+        One response per input month, in input order, with the same
+        structure as ``fetch_gregorian_month_data``. Failed requests are None.
         
-    except requests.exceptions.RequestException as e:
-        # Handle all requests-related exceptions (network, HTTP errors, etc.)
-        print(f"Error fetching data for {date_str}: {e}")
-        return None
\ No newline at end of file
+    Examples
+    --------
+    >>> results = fetch_gregorian_month_data_batch(["09-1445", "10-1445"])
+    >>> len(results)
+    2
+    """
+    date_strs = list(date_strs)
+    urls = [_URL_FMT % date_str if is_month_str(date_str) else None for date_str in date_strs]
+    return fetch_json_many(urls, date_strs)
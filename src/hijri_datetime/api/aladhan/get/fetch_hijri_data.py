@@ -36,11 +36,12 @@ Basic usage examples:
     
     # Error handling is built-in
     invalid_result = fetch_hijri_data("invalid-date")
-    # Will print error message and return None
+    # Will log a warning and return None
 
 Requirements
 ------------
 - requests
+- aiohttp (optional, speeds up batch fetches)
 
 API Reference
 -------------
@@ -48,7 +49,39 @@ Uses the Aladhan API (https://aladhan.com/hijri-gregorian-calendar-api)
 gToH endpoint with HJCoSA (Hijri Calendar of Saudi Arabia) calculation method.
 """
 
-import requests
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as json_dumps, loads as json_loads
+
+from .._http import fetch_json_many, get_json, is_date_str
+
+
+# API URL template, filled with %-formatting on each call
+_URL_FMT = "https://api.aladhan.com/v1/gToH/%s?calendarMethod=HJCoSA"
+
+# Gregorian month calendar with Hijri equivalents, used to coalesce lookups within a month
+_MONTH_URL_FMT = "https://api.aladhan.com/v1/gToHCalendar/%s/%s?calendarMethod=HJCoSA"
+
+# Distinct days of one month needed before a calendar request replaces per-day requests
+_MONTH_BATCH_MIN_DAYS = 3
+
+# Months kept in each of the two tables below, evicted oldest-first
+_MONTH_CACHE_SIZE = 256
+
+# (month, year) -> {(day, month, year): serialized day entry} for months fetched
+# successfully; entries are re-parsed on every hit so callers get their own copy
+_MONTH_INDEX = {}
+
+# (month, year) -> distinct (day, month, year) keys looked up for months not indexed yet
+_MONTH_HITS = {}
+
+
+def _bounded_put(table, key, value):
+    """Store `value` under `key`, evicting the oldest entry once the table is full."""
+    if key not in table and len(table) >= _MONTH_CACHE_SIZE:
+        table.pop(next(iter(table)), None)
+    table[key] = value
 
 
 def fetch_hijri_data(date_str):
@@ -89,7 +122,7 @@ def fetch_hijri_data(date_str):
     ------
     None
         All exceptions are caught and handled internally.
-        Error messages are printed to console.
+        Errors are logged as warnings via the logging module.
         
     Examples
     --------
@@ -107,24 +140,144 @@ def fetch_hijri_data(date_str):
     
     >>> # Invalid date handling
     >>> result = fetch_hijri_data("invalid")
-    Error fetching data for invalid: ...
     >>> print(result)
     None
     """
+    # Malformed input is rejected locally instead of costing a round trip
+    if not is_date_str(date_str):
+        return get_json(None, date_str)
+    
+    # Once enough distinct days of a month are looked up, its whole calendar
+    # is fetched and memoized, so the rest of a day-by-day scan is served
+    # locally; repeating one date does not count (the response cache has it)
+    key = _date_key(date_str)
+    month_key = key[1:]
+    index = _MONTH_INDEX.get(month_key)
+    if index is None:
+        days = _MONTH_HITS.get(month_key)
+        if days is None:
+            days = set()
+            _bounded_put(_MONTH_HITS, month_key, days)
+        days.add(key)
+        if len(days) >= _MONTH_BATCH_MIN_DAYS:
+            index = _gregorian_month_index(*month_key)
+    entry = index.get(key) if index else None
+    if entry is not None:
+        return _day_response(entry)
+    
     # Construct API URL using gToH endpoint with HJCoSA calculation method (Saudi Arabia standard)
-    url = f"https://api.aladhan.com/v1/gToH/{date_str}?calendarMethod=HJCoSA"
+    # and fetch through the response cache and the shared session; errors yield None
+    return get_json(_URL_FMT % date_str, date_str)
+
+
+def fetch_hijri_data_batch(date_strs):
+    """
+    Convert many Gregorian dates to Hijri with concurrent API requests.
     
-    try:
-        # Make HTTP request to Aladhan API
-        response = requests.get(url)
+    Parameters
+    ----------
+    date_strs : iterable of str
+        Gregorian dates in DD-MM-YYYY format
         
-        # Raise HTTPError for bad responses (4xx, 5xx)
-        response.raise_for_status()
+    Returns
+    -------
+    list of (dict or None)
+        One response per input date, in input order, with the same
+        structure as ``fetch_hijri_data``. Failed requests are None.
         
-        # Return parsed JSON data containing date conversion
-        return response.json()
+    Examples
+    --------
+    >>> results = fetch_hijri_data_batch(["01-01-2024", "15-06-2024"])
+    >>> [r['data']['hijri']['date'] for r in results if r]
+    ['19-06-1445', '09-12-1445']
+    """
+    date_strs = list(date_strs)
+    urls = [_URL_FMT % date_str if is_date_str(date_str) else None for date_str in date_strs]
+    return fetch_json_many(urls, date_strs)
+
+
+def _date_key(date_str):
+    """Return (day, month, year) as ints, so padded and unpadded dates compare equal."""
+    day, month, year = date_str.split('-')
+    return int(day), int(month), int(year)
+
+
+def _day_response(entry):
+    """Parse a serialized calendar day entry into the same envelope as the single-day gToH response."""
+    return {'code': 200, 'status': 'OK', 'data': json_loads(entry)}
+
+
+def _gregorian_month_index(month, year):
+    """
+    Return the serialized day entries of a Gregorian month keyed by (day, month, year).
+    
+    Fetches the month calendar once; returns None if that request fails.
+    """
+    index = _MONTH_INDEX.get((month, year))
+    if index is None:
+        data = get_json(_MONTH_URL_FMT % (month, year), f"{month}/{year}")
+        if not data or not isinstance(data.get('data'), list):
+            # Start counting again rather than retrying on every lookup
+            _MONTH_HITS.pop((month, year), None)
+            return None
+        index = {}
+        for entry in data['data']:
+            try:
+                index[_date_key(entry['gregorian']['date'])] = json_dumps(entry)
+            except (KeyError, TypeError, ValueError):
+                # Skip malformed entries; those days fall back to the per-day endpoint
+                continue
+        _bounded_put(_MONTH_INDEX, (month, year), index)
+        _MONTH_HITS.pop((month, year), None)
+    return index
+
+
+def fetch_hijri_dates(date_strs):
+    """
+    Convert many Gregorian dates to Hijri, coalescing dates of the same month.
+    
+    Dates are grouped by Gregorian month. A month with at least three distinct
+    requested days is fetched once from the calendar endpoint and sliced
+    locally; other dates use ``fetch_hijri_data``.
+    
+    Parameters
+    ----------
+    date_strs : iterable of str
+        Gregorian dates in DD-MM-YYYY format
         
-    except requests.exceptions.RequestException as e:
-        # Handle all requests-related exceptions (network, HTTP errors, etc.)
-        print(f"Error fetching data for {date_str}: {e}")
-        return None
\ No newline at end of file
+    Returns
+    -------
+    dict
+        Maps each input date string to a response with the same structure
+        as ``fetch_hijri_data`` (None for dates that could not be fetched).
+        Every response is a fresh object the caller may modify.
+        
+    Examples
+    --------
+    >>> dates = [f"{day:02d}-01-2024" for day in range(1, 32)]
+    >>> results = fetch_hijri_dates(dates)  # one request instead of 31
+    >>> results["01-01-2024"]['data']['hijri']['date']
+    '19-06-1445'
+    """
+    # Keys in input order, duplicates collapsed
+    results = dict.fromkeys(date_strs)
+    by_month = {}
+    for date_str in results:
+        if is_date_str(date_str):
+            key = _date_key(date_str)
+            by_month.setdefault(key[1:], []).append((date_str, key))
+        else:
+            # Reports the invalid input and yields None
+            results[date_str] = fetch_hijri_data(date_str)
+    
+    for (month, year), items in by_month.items():
+        index = _MONTH_INDEX.get((month, year))
+        if index is None and len({key for _, key in items}) >= _MONTH_BATCH_MIN_DAYS:
+            index = _gregorian_month_index(month, year)
+        for date_str, key in items:
+            entry = index.get(key) if index else None
+            if entry is not None:
+                results[date_str] = _day_response(entry)
+            else:
+                results[date_str] = fetch_hijri_data(date_str)
+    return results
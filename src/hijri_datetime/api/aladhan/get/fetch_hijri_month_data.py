@@ -49,11 +49,13 @@ Basic usage examples:
     
     # Error handling is built-in
     invalid_result = fetch_hijri_month_data(13, 1445)  # Invalid month
-    # Will print error message and return None
+    # Will log a warning and return None
 
 Requirements
 ------------
 - requests
+- aiohttp (optional, speeds up batch fetches)
+- ijson (iter_hijri_month_days only)
 
 API Reference
 -------------
@@ -61,7 +63,15 @@ Uses the Aladhan API (https://aladhan.com/hijri-gregorian-calendar-api)
 hToGCalendar endpoint with HJCoSA (Hijri Calendar of Saudi Arabia) calculation method.
 """
 
-import requests
+import logging
+
+from .._http import _SESSION, REQUEST_TIMEOUT, RequestException, cache_get, fetch_json_many, get_json, is_month_year
+
+
+logger = logging.getLogger(__name__)
+
+# API URL template, filled with %-formatting on each call
+_URL_FMT = "https://api.aladhan.com/v1/hToGCalendar/%s/%s?calendarMethod=HJCoSA"
 
 
 def fetch_hijri_month_data(month, year):
@@ -109,7 +119,7 @@ def fetch_hijri_month_data(month, year):
     ------
     None
         All exceptions are caught and handled internally.
-        Error messages are printed to console.
+        Errors are logged as warnings via the logging module.
         
     Examples
     --------
@@ -130,24 +140,93 @@ def fetch_hijri_month_data(month, year):
     
     >>> # Invalid month handling
     >>> result = fetch_hijri_month_data(13, 1445)
-    Error fetching data for 13/1445: ...
     >>> print(result)
     None
     """
     # Construct API URL using hToGCalendar endpoint with separate month/year parameters
-    url = f"https://api.aladhan.com/v1/hToGCalendar/{month}/{year}?calendarMethod=HJCoSA"
+    # Malformed input is rejected locally instead of costing a round trip
+    url = _URL_FMT % (month, year) if is_month_year(month, year) else None
     
-    try:
-        # Make HTTP request with explicit JSON accept header
-        response = requests.get(url, headers={'accept': 'application/json'})
+    # Fetch through the response cache and the shared session; errors yield None
+    return get_json(url, f"{month}/{year}", headers={'accept': 'application/json'})
+
+
+def fetch_hijri_month_data_batch(months):
+    """
+    Fetch several Hijri month calendars with concurrent API requests.
+    
+    Parameters
+    ----------
+    months : iterable of (int, int)
+        (month, year) pairs of Hijri months
+        
+    Returns
+    -------
+    list of (dict or None)
+        One response per input month, in input order, with the same
+        structure as ``fetch_hijri_month_data``. Failed requests are None.
         
-        # Raise HTTPError for bad responses (4xx, 5xx)
-        response.raise_for_status()
+    Examples
+    --------
+    >>> results = fetch_hijri_month_data_batch([(9, 1445), (10, 1445)])
+    >>> [r['data'][0]['gregorian']['date'] for r in results if r]
+    ['11-03-2024', '10-04-2024']
+    """
+    months = list(months)
+    urls = [_URL_FMT % (month, year) if is_month_year(month, year) else None
+            for month, year in months]
+    return fetch_json_many(urls, [f"{month}/{year}" for month, year in months])
+
+
+def iter_hijri_month_days(month, year):
+    """
+    Stream the days of a Hijri month calendar one entry at a time.
+    
+    The response body is parsed incrementally, so callers looking for a
+    single day can stop early without the whole month being materialized.
+    A month already in the response cache is iterated from there.
+    
+    Parameters
+    ----------
+    month : int
+        Hijri month number (1-12)
+    year : int
+        Hijri year (e.g., 1445)
         
-        # Return parsed JSON data containing full month calendar
-        return response.json()
+    Yields
+    ------
+    dict
+        One day entry with the same structure as the items of
+        ``fetch_hijri_month_data(month, year)['data']``. Nothing is yielded
+        if the request fails; the error is logged as for the other fetchers.
         
-    except requests.exceptions.RequestException as e:
-        # Handle all requests-related exceptions (network, HTTP errors, etc.)
-        print(f"Error fetching data for {month}/{year}: {e}")
-        return None
\ No newline at end of file
+    Examples
+    --------
+    >>> for day_data in iter_hijri_month_days(9, 1445):
+    ...     if day_data['hijri']['day'] == '27':
+    ...         print(day_data['gregorian']['date'])
+    ...         break
+    06-04-2024
+    """
+    import ijson
+    
+    if not is_month_year(month, year):
+        logger.warning("Error fetching data for %s/%s: invalid input, request not sent", month, year)
+        return
+    url = _URL_FMT % (month, year)
+    
+    cached = cache_get(url)
+    if cached is not None:
+        yield from cached.get('data', [])
+        return
+    
+    try:
+        with _SESSION.get(url, headers={'accept': 'application/json'},
+                          timeout=REQUEST_TIMEOUT, stream=True) as response:
+            response.raise_for_status()
+            # Let urllib3 undo any gzip/deflate transfer encoding while streaming
+            response.raw.decode_content = True
+            yield from ijson.items(response.raw, 'data.item')
+            
+    except (RequestException, ijson.JSONError) as e:
+        logger.warning("Error fetching data for %s/%s: %s", month, year, e)
@@ -87,12 +87,12 @@ def get_api_day_data(api_response):
         
     Returns
     -------
-    tuple of (dict, dict) or None
-        Returns tuple of (date_dict, holidays_dict) if processing successful.
+    tuple of (DateRow, HolidayRow) or None
+        Returns tuple of (date_row, holidays_row) if processing successful.
         Returns None if API response is invalid or processing fails.
         
-        - date_dict: Processed date information
-        - holidays_dict: Processed holiday information
+        - date_row: Processed date information (named tuple)
+        - holidays_row: Processed holiday information (named tuple)
         
     Raises
     ------
@@ -129,18 +129,12 @@ def get_api_day_data(api_response):
     None
     """
     # Validate API response exists and has successful status code
-    if not api_response or api_response.get('code') != 200:
+    if not api_response:
+        return None
+    response_get = api_response.get
+    if response_get('code') != 200:
         return None
     
-    # Extract data payload from API response
-    data = api_response.get('data', {})
-    
-    # Process the raw data through utility function
-    processed_data = process_one_day_date_data(data)
-    
-    # Return processed data if valid, None otherwise
-    if processed_data:
-        date_dict, holidays_dict = processed_data
-        return date_dict, holidays_dict
-    
-    return None
+    # Process the data payload; the utility already returns the
+    # (date_row, holidays_row) tuple, or None if the entry is invalid
+    return process_one_day_date_data(response_get('data', {})) or None
@@ -75,7 +75,34 @@ This module depends on:
 - process_one_day_date_data function from utils.process_one_day_date_data
 """
 
-from .utils.process_one_day_date_data import process_one_day_date_data
+import pandas as pd
+
+from .utils.process_one_day_date_data import DateRow, HolidayRow, process_one_day_date_data
+
+
+# Processed calendar months keyed by _month_key, evicted oldest-first
+_MONTH_CACHE_SIZE = 512
+_MONTH_CACHE = {}
+
+
+def _month_key(entries):
+    """
+    Build a hashable key identifying a calendar month response.
+
+    The first and last days' Gregorian and Hijri dates plus the calendar
+    method pin down the month (and any Hijri adjustment) whichever
+    calendar endpoint produced it. Returns None if the entries lack them.
+    """
+    try:
+        first, last = entries[0], entries[-1]
+        return (
+            len(entries),
+            first['gregorian']['date'], first['hijri']['date'],
+            last['gregorian']['date'], last['hijri']['date'],
+            first['hijri'].get('method', ''),
+        )
+    except (IndexError, KeyError, TypeError, AttributeError):
+        return None
 
 
 # ===================== MAIN PROCESSING FUNCTIONS =====================
@@ -117,11 +144,11 @@ def get_api_month_data(api_response):
     Returns
     -------
     tuple of (list, list) or None
-        Returns tuple of (date_dict_list, holidays_dict_list) if successful.
+        Returns tuple of (date_rows, holiday_rows) if successful.
         Returns None if API response is invalid or processing fails.
         
-        - date_dict_list: List of processed date dictionaries
-        - holidays_dict_list: List of processed holiday dictionaries
+        - date_rows: List of ``DateRow`` named tuples
+        - holiday_rows: List of ``HolidayRow`` named tuples
         
         Both lists have the same length, with corresponding indices 
         representing the same day's data.
@@ -169,33 +196,69 @@ def get_api_month_data(api_response):
     >>> print(result)
     None
     """
-    # Initialize result lists for processed data
-    date_dict_list = []
-    holidays_dict_list = []
-    
     # Validate API response exists and has successful status code
-    if not api_response or api_response.get('code') != 200:
+    if not api_response:
+        return None
+    response_get = api_response.get
+    if response_get('code') != 200:
         return None
     
     # Extract data payload from API response
-    data = api_response.get('data', {})
+    data = response_get('data', {})
     
     # Handle both single day and multiple days (calendar array) responses
-    if isinstance(data, list):
-        # Process array of daily entries (calendar month response)
-        for date_entry in data:
-            processed_data = process_one_day_date_data(date_entry)
-            if processed_data:  # Only add valid processed data
-                date_dict, holidays_dict = processed_data
-                date_dict_list.append(date_dict)
-                holidays_dict_list.append(holidays_dict)
-    else:
-        # Process single day entry
-        processed_data = process_one_day_date_data(data)
-        if processed_data:  # Only add valid processed data
-            date_dict, holidays_dict = processed_data
-            date_dict_list.append(date_dict)
-            holidays_dict_list.append(holidays_dict)
+    entries = data if isinstance(data, list) else [data]
+    
+    # Repeated calendar months are served from the cache; rows are immutable,
+    # so only the lists are copied
+    key = _month_key(entries) if isinstance(data, list) else None
+    cached = _MONTH_CACHE.get(key) if key is not None else None
+    if cached is not None:
+        return list(cached[0]), list(cached[1])
+    
+    # Process all entries in one pass, keeping only valid (DateRow, HolidayRow) pairs
+    pairs = [processed for processed in map(process_one_day_date_data, entries) if processed]
     
     # Return lists of processed data (empty lists if no valid data found)
-    return date_dict_list, holidays_dict_list
\ No newline at end of file
+    if not pairs:
+        return [], []
+    date_rows, holiday_rows = map(list, zip(*pairs))
+    if key is not None:
+        if len(_MONTH_CACHE) >= _MONTH_CACHE_SIZE:
+            _MONTH_CACHE.pop(next(iter(_MONTH_CACHE)), None)
+        _MONTH_CACHE[key] = (tuple(date_rows), tuple(holiday_rows))
+    return date_rows, holiday_rows
+
+
+def get_api_month_dataframe(api_response):
+    """
+    Process an API response straight into date and holiday DataFrames.
+    
+    Same input and validation as ``get_api_month_data``, for callers that
+    want tabular output without handling the intermediate lists.
+    
+    Parameters
+    ----------
+    api_response : dict or None
+        Single-day or calendar API response (see ``get_api_month_data``).
+        
+    Returns
+    -------
+    tuple of (pd.DataFrame, pd.DataFrame) or None
+        Returns (dates_df, holidays_df) with one row per valid day.
+        Returns None if the API response is invalid.
+        
+    Examples
+    --------
+    >>> result = get_api_month_dataframe(calendar_resp)
+    >>> if result:
+    ...     dates_df, holidays_df = result
+    ...     print(dates_df[['g_year', 'g_month', 'g_day']].head())
+    """
+    processed = get_api_month_data(api_response)
+    if processed is None:
+        return None
+    date_rows, holiday_rows = processed
+    # Explicit columns keep the schema even for months with no valid days
+    return (pd.DataFrame(date_rows, columns=DateRow._fields),
+            pd.DataFrame(holiday_rows, columns=HolidayRow._fields))
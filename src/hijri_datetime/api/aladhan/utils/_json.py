@@ -0,0 +1,20 @@
+"""
+JSON encode/decode helpers for the Aladhan utils.
+
+Uses orjson when installed, then ujson, then the standard library. ``dumps``
+always returns ``str`` and ``loads`` accepts ``str`` or ``bytes``.
+"""
+
+try:
+    import orjson
+
+    def dumps(obj):
+        """Serialize `obj` to a JSON string."""
+        return orjson.dumps(obj).decode('utf-8')
+
+    loads = orjson.loads
+except ImportError:
+    try:
+        from ujson import dumps, loads
+    except ImportError:
+        from json import dumps, loads
@@ -1,17 +1,40 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pandas as pd
+
+from ..get_api_month_data import get_api_month_data
+from ._json import loads
+
+
+logger = logging.getLogger(__name__)
+
+
+def _load_and_process(entry):
+    """Load one saved month response and return its date rows, or None on failure"""
+    with open(entry.path, "rb") as f:
+        try:
+            data = loads(f.read())
+        except ValueError as e:
+            logger.warning("Failed to parse %s: %s", entry.name, e)
+            return None
+    logger.debug("Loaded %s Len: %d", entry.name, len(data))
+    result = get_api_month_data(data)
+    return result[0] if result else None
+
+
 def json_files_dict():
     """Check if response file exists for a given month/year and load it"""
     json_dir = "debug_responses_month"
-    dict_list = []
-    # Loop through files in the directory
-    for filename in os.listdir(json_dir):
-        if filename.endswith(".json"):  # only process JSON
-            file_path = os.path.join(json_dir, filename)
-            with open(file_path, "r", encoding="utf-8") as f:
-                try:
-                    data = json.load(f)
-                    print(f"✅ Loaded {filename} Len: {len(data)}:")
-                    # do your processing here
-                    dict_list.append(process_date_data(data))
-                except json.JSONDecodeError as e:
-                    print(f"❌ Failed to parse {filename}: {e}")
-    return pd.Dateframe(dict_list)
\ No newline at end of file
+    # scandir yields the full paths without an extra join per file
+    entries = [e for e in os.scandir(json_dir) if e.name.endswith(".json")]
+    # Reading and parsing the files is independent, so spread it over threads
+    with ThreadPoolExecutor() as pool:
+        dict_list = [
+            row
+            for rows in pool.map(_load_and_process, entries)
+            if rows is not None
+            for row in rows
+        ]
+    return pd.DataFrame(dict_list)
@@ -1,5 +1,32 @@
-from .safe_get import safe_get
-import json
+from typing import NamedTuple
+
+
+class DateRow(NamedTuple):
+    """One day's Gregorian and Hijri date fields as returned by the API."""
+    g_day: str
+    g_month: int
+    g_year: str
+    h_day: str
+    h_month: int
+    h_year: str
+    hijri_method: str
+
+
+class HolidayRow(NamedTuple):
+    """
+    One day's holidays.
+
+    The holiday names are kept as tuples rather than JSON strings; serialize
+    them (e.g. with ``orjson.dumps``) only when writing rows out to CSV or a
+    database.
+    """
+    gregorian_date: str
+    hijri_holidays: tuple
+    hijri_adjustedHolidays: tuple
+
+
+# Shared read-only default for missing fields; never mutated
+_EMPTY_D = {}
 
 
 def process_one_day_date_data(date_entry):
@@ -12,26 +39,29 @@ def process_one_day_date_data(date_entry):
         return None
     
     # Extract hijri and gregorian data directly from date entry
-    hijri = date_entry.get('hijri', {})
-    gregorian = date_entry.get('gregorian', {})    
-
-    # Holiday information (serialize lists to JSON strings)
-    holidays_dict = {
-        'gregorian_date': gregorian.get('date', ''),
-        'hijri_holidays': json.dumps(hijri.get('holidays', [])),
-        'hijri_adjustedHolidays': json.dumps(hijri.get('adjustedHolidays', [])),
-    }
+    hijri = date_entry['hijri'] or _EMPTY_D
+    gregorian = date_entry['gregorian'] or _EMPTY_D
+    hijri_get = hijri.get
+    gregorian_get = gregorian.get
+
+    # Holiday information (kept unserialized until written out; tuples so
+    # rows stay immutable and never alias the cached API response)
+    holidays_row = HolidayRow(
+        gregorian_get('date', ''),
+        tuple(hijri_get('holidays') or ()),
+        tuple(hijri_get('adjustedHolidays') or ()),
+    )
     
-    date_dict = {        
-        'g_day': gregorian.get('day', ''),
-        'g_month': safe_get(gregorian, 'month.number', ''),
-        'g_year': gregorian.get('year', ''),
-        'h_day': hijri.get('day', ''),
-        'h_month': safe_get(hijri, 'month.number', ''),
-        'h_year': hijri.get('year', ''),
-        'hijri_method': hijri.get('method', '')
-    }
+    date_row = DateRow(
+        gregorian_get('day', ''),
+        (gregorian_get('month') or _EMPTY_D).get('number', ''),
+        gregorian_get('year', ''),
+        hijri_get('day', ''),
+        (hijri_get('month') or _EMPTY_D).get('number', ''),
+        hijri_get('year', ''),
+        hijri_get('method', ''),
+    )
     
     # ===================== RETURN STRUCTURED DATA =====================
-    # Combine all three calendar systems into single dictionary
-    return date_dict, holidays_dict
\ No newline at end of file
+    # Rows are tuples with named fields; pd.DataFrame takes the field names as columns
+    return date_row, holidays_row
@@ -1,5 +1,14 @@
+from functools import lru_cache
+
+
 # ===================== UTILITY FUNCTIONS =====================
 
+@lru_cache(maxsize=256)
+def _split_path(path):
+    """Split a dot-separated path once; call sites reuse a handful of literal paths."""
+    return tuple(path.split('.'))
+
+
 def safe_get(data, path, default=""):
     """
     Safely extract nested dictionary values with dot notation.
@@ -33,7 +42,7 @@ def safe_get(data, path, default=""):
     'fallback'
     """
     try:
-        keys = path.split('.')
+        keys = _split_path(path)
         result = data
         # Navigate through each key in the path
         for key in keys:
@@ -25,9 +25,19 @@ Quick start example:
     print(month_range)
 """
 
+import logging
+
 import pandas as pd
 from typing import Optional
 from hijri_datetime.data import DatabaseLoader
+from hijri_datetime.data.utils._load_mapping_data import COLUMN_DTYPES
+
+
+logger = logging.getLogger(__name__)
+
+
+# Lookup precision returned by DateMapping.get_dtype
+DTYPE_DATE, DTYPE_MONTH, DTYPE_YEAR = 1, 2, 3
 
 
 class DateMapping:
@@ -35,6 +45,9 @@ class DateMapping:
     Bidirectional Gregorian ↔ Hijri date conversion using preloaded mapping data.
 
     Optimized for speed with large datasets using pandas MultiIndex lookups.
+    Date columns are stored as int8 (days, months) and int16 (years), so
+    years must lie within -32768..32767; the bundled Gregorian and Hijri
+    ranges are far inside that. ``hijri_method`` is stored as a category.
 
     Parameters
     ----------
@@ -58,16 +71,25 @@ class DateMapping:
         ----------
         loader : DatabaseLoader
             Data loader containing date mapping with required columns:
-            ['day', 'month', 'year', 'h_day', 'h_month', 'h_year', 'hijri_method']
+            ['g_day', 'g_month', 'g_year', 'h_day', 'h_month', 'h_year', 'hijri_method']
         """
         # Load data or create empty DataFrame with required columns
         self.df = (
             loader._data if isinstance(loader._data, pd.DataFrame)
             else pd.DataFrame(columns=[
-                'day', 'month', 'year', 'h_day', 'h_month', 'h_year', 'hijri_method'
+                'g_day', 'g_month', 'g_year', 'h_day', 'h_month', 'h_year', 'hijri_method'
                 ]
             ))
 
+        # The loader's storage dtypes (see the class docstring for ranges);
+        # a no-op for loader data, and normalizes the empty fallback frame
+        self.df = self.df.astype(COLUMN_DTYPES)
+
+        # Gregorian- and Hijri-keyed views, built once: lookups become
+        # sorted-index probes instead of full-column scans on every call
+        self._by_greg = self.df.set_index(['g_year', 'g_month', 'g_day']).sort_index()
+        self._by_hijri = self.df.set_index(['h_year', 'h_month', 'h_day']).sort_index()
+
     def get_dtype(self, year: int, month: Optional[int], day: Optional[int]):
         """
         Determine date lookup type based on provided date components.
@@ -83,50 +105,49 @@ class DateMapping:
 
         Returns
         -------
-        str or None
-            Date type: "date" (exact), "month_range", "year_range", or None
+        int or None
+            Lookup type: ``DTYPE_DATE`` (exact date), ``DTYPE_MONTH`` (month
+            range), ``DTYPE_YEAR`` (year range), or None
 
         Examples
         --------
-        >>> mapper.get_dtype(2024, 1, 15)
-        'date'
-        >>> mapper.get_dtype(2024, 1, None)
-        'month_range'
-        >>> mapper.get_dtype(2024, None, None)
-        'year_range'
+        >>> mapper.get_dtype(2024, 1, 15) == DTYPE_DATE
+        True
+        >>> mapper.get_dtype(2024, 1, None) == DTYPE_MONTH
+        True
+        >>> mapper.get_dtype(2024, None, None) == DTYPE_YEAR
+        True
         """
-        Allowed = ["datetime", "date", "month_range", "year_range"]
-
-        # Exact date: year + month + day
-        if year and month and day:
-            return Allowed[1]
-        # Month range: year + month (no day)
-        if year and month and not day:
-            return Allowed[2]
-        # Year range: only year
-        if year and not month and not day:
-            return Allowed[3]
-        return None
-
-    def to_hijri(year: int, month: Optional[int], day: Optional[int]):
+        if not year:
+            return None
+        # Exact date: year + month + day; month range: year + month (no day)
+        if month:
+            return DTYPE_DATE if day else DTYPE_MONTH
+        # Year range: only year (a day without a month is not a valid lookup)
+        return None if day else DTYPE_YEAR
+
+    def to_hijri(self, year: int, month: Optional[int], day: Optional[int]):
         """
         Convert Gregorian date to Hijri equivalent.
 
-        Optimized for large datasets using MultiIndex for O(log n) lookups.
+        Optimized for large datasets using the precomputed (g_year, g_month, g_day)
+        MultiIndex for O(log n) lookups. Omitting ``day`` (or ``month`` and
+        ``day``) returns the whole month (or year).
 
         Parameters
         ----------
-        g_year : int
+        year : int
             Gregorian year
-        g_month : int
+        month : int, optional
             Gregorian month (1-12)
-        g_day : int
+        day : int, optional
             Gregorian day (1-31)
 
         Returns
         -------
-        pd.DataFrame or pd.Series
-            Hijri date with columns: ['h_day', 'h_month', 'h_year', 'hijri_method']
+        pd.DataFrame
+            Hijri date(s) with columns: ['h_day', 'h_month', 'h_year', 'hijri_method'],
+            indexed by (g_year, g_month, g_day).
             Empty DataFrame if no matching dates found
 
         Examples
@@ -134,31 +155,35 @@ class DateMapping:
         >>> hijri = mapper.to_hijri(2024, 1, 15)
         >>> print(hijri[['h_year', 'h_month', 'h_day']])
         """
-        # Set multi-index for efficient date-based lookups
-        # This allows queries like df.loc[(2024, 1, 15)] for specific dates
-        df = self.df.set_index(["year", "month", "day"])
-
         dtype = self.get_dtype(year, month, day)
 
-        # Get Hijri equivalent based on date type
-        if dtype == "date":
-            result = df[(df['g_year']==year) and (df['g_month']==month) and (df['g_day']==day)]
-        elif dtype == "month_range":
-            result = df[(df['g_year']==year) and (df['g_month']==month)]
-        elif dtype == "year_range":
-            result = df[(df['g_year']==year)]
-        result =  pd.DataFrame()
-        
+        # Key prefix for the requested precision, probed on the index built in
+        # __init__; a label slice returns all matching rows (or none)
+        if dtype == DTYPE_DATE:
+            key = (year, month, day)
+        elif dtype == DTYPE_MONTH:
+            key = (year, month)
+        elif dtype == DTYPE_YEAR:
+            key = year
+        else:
+            return pd.DataFrame()
+
+        result = self._by_greg.loc[key:key]
+
         if result.empty:
-            print(f"   ℹ  Gregorian date for Hijri {year}-{month}-{day} not available in dataset")
-        
+            logger.debug("Hijri date for Gregorian %s-%s-%s not available in dataset", year, month, day)
+            return pd.DataFrame()
+
         return result
 
-    def to_greg(self, year: int, month: Optional[int], day: Optional[int]):
+    def to_greg(self, h_year: int, h_month: Optional[int], h_day: Optional[int]):
         """
         Convert Hijri date to Gregorian equivalent.
 
-        Uses pandas boolean indexing for efficient filtering on large datasets.
+        Uses the precomputed (h_year, h_month, h_day) MultiIndex, so each call
+        is a binary search on the sorted index rather than a full scan.
+        Omitting ``h_day`` (or ``h_month`` and ``h_day``) returns the whole
+        month (or year).
 
         Parameters
         ----------
@@ -172,23 +197,91 @@ class DateMapping:
         Returns
         -------
         pd.DataFrame
-            Gregorian date(s) with columns: ['year', 'month', 'day', 'hijri_method']
+            Gregorian date(s) with columns: ['g_day', 'g_month', 'g_year', 'hijri_method'],
+            indexed by (h_year, h_month, h_day).
             Empty DataFrame if no matching dates found
 
         Examples
         --------
         >>> greg = mapper.to_greg(1445, 7, 4)
-        >>> print(greg[['year', 'month', 'day']])
+        >>> print(greg[['g_year', 'g_month', 'g_day']])
         """
-        # Use vectorized boolean indexing for speed with large datasets
-        mask = ((self.df['h_year'] == h_year) &
-                (self.df['h_month'] == h_month) &
-                (self.df['h_day'] == h_day))
+        dtype = self.get_dtype(h_year, h_month, h_day)
+
+        # Key prefix for the requested precision; a label slice on the sorted
+        # index returns every matching row (or none) without raising KeyError
+        if dtype == DTYPE_DATE:
+            key = (h_year, h_month, h_day)
+        elif dtype == DTYPE_MONTH:
+            key = (h_year, h_month)
+        elif dtype == DTYPE_YEAR:
+            key = h_year
+        else:
+            return pd.DataFrame()
 
-        result = self.df[mask]
+        result = self._by_hijri.loc[key:key]
 
         if result.empty:
-            print(f"   ℹ  Gregorian date for Hijri {h_year}-{h_month}-{h_day} not available in dataset")
+            logger.debug("Gregorian date for Hijri %s-%s-%s not available in dataset", h_year, h_month, h_day)
             return pd.DataFrame()
 
         return result
+
+    def _lookup_many(self, key_columns, years, months, days):
+        """Inner-join an array of full dates on `key_columns`, keeping query order."""
+        query = pd.DataFrame(dict(zip(key_columns, (years, months, days))))
+        return query.merge(self.df, on=key_columns, how='inner').set_index(key_columns)
+
+    def to_hijri_many(self, years, months, days):
+        """
+        Convert many Gregorian dates to Hijri in one vectorized join.
+
+        Prefer this over calling ``to_hijri`` in a loop when the dates are
+        already in arrays or columns. Only exact dates are supported; use
+        ``to_hijri`` for month and year ranges.
+
+        Parameters
+        ----------
+        years, months, days : array-like of int
+            Gregorian date components, all of the same length
+
+        Returns
+        -------
+        pd.DataFrame
+            Hijri date(s) with columns: ['h_day', 'h_month', 'h_year', 'hijri_method'],
+            indexed by (g_year, g_month, g_day) in query order. Dates missing
+            from the dataset are dropped; dates with several methods appear
+            once per method.
+
+        Examples
+        --------
+        >>> hijri = mapper.to_hijri_many([2024, 2024], [1, 3], [15, 11])
+        """
+        return self._lookup_many(['g_year', 'g_month', 'g_day'], years, months, days)
+
+    def to_greg_many(self, h_years, h_months, h_days):
+        """
+        Convert many Hijri dates to Gregorian in one vectorized join.
+
+        Prefer this over calling ``to_greg`` in a loop when the dates are
+        already in arrays or columns. Only exact dates are supported; use
+        ``to_greg`` for month and year ranges.
+
+        Parameters
+        ----------
+        h_years, h_months, h_days : array-like of int
+            Hijri date components, all of the same length
+
+        Returns
+        -------
+        pd.DataFrame
+            Gregorian date(s) with columns: ['g_day', 'g_month', 'g_year', 'hijri_method'],
+            indexed by (h_year, h_month, h_day) in query order. Dates missing
+            from the dataset are dropped; dates with several methods appear
+            once per method.
+
+        Examples
+        --------
+        >>> greg = mapper.to_greg_many([1445, 1445], [7, 9], [4, 1])
+        """
+        return self._lookup_many(['h_year', 'h_month', 'h_day'], h_years, h_months, h_days)
@@ -1,5 +1,7 @@
-from .date_loader import DatabaseLoader
+from .date_loader import DatabaseLoader, get_loader, invalidate_loader
 
 __all__ = [
-    "DatabaseLoader"
+    "DatabaseLoader",
+    "get_loader",
+    "invalidate_loader",
 ]
\ No newline at end of file
@@ -1,4 +1,6 @@
+import functools
 import os
+import numpy as np
 import pandas as pd
 from typing import Optional, Dict, List, Union
 from dataclasses import dataclass
@@ -7,6 +9,27 @@ from .utils._load_mapping_data import _load_mapping_data
 from .utils._load_hijri_holydays import _load_hijri_holydays
 
 
+def _pack_dates(years, months, days):
+    """
+    Pack (year, month, day) arrays into sortable int32 keys.
+
+    The day takes the low 5 bits and the month the next 4, so keys order
+    chronologically and a whole month or year is one contiguous key range.
+    """
+    return (
+        (np.asarray(years, dtype=np.int32) << 9)
+        | (np.asarray(months, dtype=np.int32) << 5)
+        | np.asarray(days, dtype=np.int32)
+    )
+
+
+def _sorted_keys(years, months, days):
+    """Return (keys, order): the packed keys sorted, and the row positions in that order."""
+    keys = _pack_dates(years, months, days)
+    order = np.argsort(keys, kind="stable")
+    return keys[order], order
+
+
 class DatabaseLoader:
     """
     Calendar data loader with caching and validation capabilities.
@@ -46,7 +69,20 @@ class DatabaseLoader:
         csv_path : str, optional
             Path to the CSV file containing calendar mapping data.
         """
-        self._data = self.load_data()  # Cache for loaded data
+        self._data = None  # Cache for loaded data
+        # Sorted packed date keys and matching row positions, per calendar
+        self._g_keys = self._g_order = None
+        self._h_keys = self._h_order = None
+        # Other-calendar (day, month, year, method code) rows in key order,
+        # method names by code, and memoized exact-date results
+        self._g_vals = self._h_vals = None
+        # Result columns of Gregorian lookups (Hijri side) and of Hijri lookups
+        self._g_projected = self._h_projected = None
+        self._methods = ()
+        self._g_memo = {}
+        self._h_memo = {}
+        self._ranges = None  # Year bounds per calendar, see date_ranges()
+        self.load_data()
 
     def load_data(self):
         """
@@ -76,8 +112,172 @@ class DatabaseLoader:
         """
         if self._data is None:
             self._data = _load_mapping_data()
+            self._build_key_arrays()
         return self._data
 
+    def _build_key_arrays(self):
+        """
+        Build the contiguous lookup arrays for both calendars.
+
+        Lookups binary-search the sorted int32 keys with ``np.searchsorted``
+        and map the hit range back to rows through the order array, instead
+        of walking a pandas MultiIndex.
+        """
+        data = self._data
+        self._g_keys, self._g_order = _sorted_keys(
+            data['g_year'].to_numpy(), data['g_month'].to_numpy(), data['g_day'].to_numpy())
+        self._h_keys, self._h_order = _sorted_keys(
+            data['h_year'].to_numpy(), data['h_month'].to_numpy(), data['h_day'].to_numpy())
+
+        # Column projections taken once, so range lookups slice rows only
+        self._g_projected = data[['h_day', 'h_month', 'h_year', 'hijri_method']]
+        self._h_projected = data[['g_day', 'g_month', 'g_year', 'hijri_method']]
+
+        methods = data['hijri_method'].astype('category')
+        self._methods = tuple(methods.cat.categories)
+        codes = methods.cat.codes.to_numpy()
+        self._g_vals = np.column_stack([
+            data['h_day'].to_numpy(), data['h_month'].to_numpy(), data['h_year'].to_numpy(), codes,
+        ]).astype(np.int32)[self._g_order]
+        self._h_vals = np.column_stack([
+            data['g_day'].to_numpy(), data['g_month'].to_numpy(), data['g_year'].to_numpy(), codes,
+        ]).astype(np.int32)[self._h_order]
+        self._g_memo = {}
+        self._h_memo = {}
+
+        # The keys are sorted, so the year bounds are their first and last entries
+        self._ranges = {
+            'gregorian': {'min': int(self._g_keys[0] >> 9), 'max': int(self._g_keys[-1] >> 9)},
+            'hijri': {'min': int(self._h_keys[0] >> 9), 'max': int(self._h_keys[-1] >> 9)},
+        } if len(data) else {
+            'gregorian': {'min': None, 'max': None},
+            'hijri': {'min': None, 'max': None},
+        }
+
+    def _exact_rows(self, hijri, year, month, day):
+        """
+        Return the other calendar's rows for one exact date, without pandas.
+
+        Parameters
+        ----------
+        hijri : bool
+            True if (year, month, day) is a Hijri date, False if Gregorian.
+        year, month, day : int
+            The date to look up.
+
+        Returns
+        -------
+        tuple of (day, month, year, hijri_method) or None
+            One tuple per calendar method that maps the date, or None if the
+            date is not in the dataset.
+
+        Notes
+        -----
+        Each distinct date is probed once and memoized in a dict keyed by the
+        packed date, so repeated lookups are a single dict access. Building
+        the dict for every row up front would cost seconds and ~100 MB per
+        calendar, so it only grows with the dates actually requested.
+        """
+        memo = self._h_memo if hijri else self._g_memo
+        key = (year << 9) | (month << 5) | day
+        rows = memo.get(key)
+        if rows is None:
+            keys, vals = (self._h_keys, self._h_vals) if hijri else (self._g_keys, self._g_vals)
+            start = keys.searchsorted(key, side='left')
+            stop = keys.searchsorted(key, side='right')
+            methods = self._methods
+            rows = tuple((d, m, y, methods[c]) for d, m, y, c in vals[start:stop].tolist())
+            memo[key] = rows
+        return rows or None
+
+    def _probe(self, hijri, years, months, days):
+        """
+        Find the first row of each exact date in one vectorized pass.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            (rows, hit): the other calendar's (day, month, year, method code)
+            row for each date, and a bool array that is False where the
+            date is out of range or not in the dataset (its row is then
+            meaningless).
+        """
+        keys, vals = (self._h_keys, self._h_vals) if hijri else (self._g_keys, self._g_vals)
+        years = np.asarray(years, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+        # Out-of-range parts would spill into a neighbouring packed key
+        # (month 17 of one year is month 1 of the next), so mask them first
+        valid = ((years >= 0) & (years < 1 << 22)
+                 & (months >= 1) & (months <= 12) & (days >= 1) & (days <= 31))
+        if not len(keys):
+            return np.full((len(years), 4), -1, dtype=np.int32), np.zeros(len(years), dtype=bool)
+        packed = _pack_dates(np.where(valid, years, 0), np.where(valid, months, 0), np.where(valid, days, 0))
+        # Clip so misses past the last key still index safely before masking
+        pos = np.minimum(keys.searchsorted(packed), len(keys) - 1)
+        return vals[pos], valid & (keys[pos] == packed)
+
+    def _probe_many(self, hijri, years, months, days):
+        """
+        Map arrays of exact dates to the other calendar in one vectorized pass.
+
+        Parameters
+        ----------
+        hijri : bool
+            True if the input dates are Hijri, False if Gregorian.
+        years, months, days : array-like of int
+            Date components, all of the same length.
+
+        Returns
+        -------
+        tuple of numpy.ndarray
+            (years, months, days) int32 arrays of the converted dates; -1
+            marks dates that are out of range or not in the dataset. Where a
+            date maps under several methods, the first row in key order is
+            used.
+        """
+        rows, hit = self._probe(hijri, years, months, days)
+        out = np.where(hit[:, None], rows[:, :3], -1)
+        return out[:, 2], out[:, 1], out[:, 0]
+
+    def _frame_many(self, hijri, years, months, days):
+        """
+        Map arrays of exact dates to the other calendar as one DataFrame.
+
+        Parameters
+        ----------
+        hijri : bool
+            True if the input dates are Hijri, False if Gregorian.
+        years, months, days : array-like of int
+            Date components, all of the same length.
+
+        Returns
+        -------
+        pandas.DataFrame
+            One row per input date, indexed by the input (year, month, day),
+            with the other calendar's day/month/year and ``hijri_method``
+            columns. Dates out of range or not in the dataset give an
+            all-missing row; where a date maps under several methods, the
+            first in key order is used.
+        """
+        src, dst = ('h', 'g') if hijri else ('g', 'h')
+        years = np.asarray(years, dtype=np.int64)
+        months = np.asarray(months, dtype=np.int64)
+        days = np.asarray(days, dtype=np.int64)
+        rows, hit = self._probe(hijri, years, months, days)
+        miss = ~hit
+
+        index = pd.MultiIndex.from_arrays(
+            [years, months, days], names=[f'{src}_year', f'{src}_month', f'{src}_day'])
+        return pd.DataFrame({
+            # Nullable integers so misses stay missing without falling back to float
+            f'{dst}_day': pd.arrays.IntegerArray(rows[:, 0].astype(np.int8), miss),
+            f'{dst}_month': pd.arrays.IntegerArray(rows[:, 1].astype(np.int8), miss),
+            f'{dst}_year': pd.arrays.IntegerArray(rows[:, 2].astype(np.int16), miss),
+            'hijri_method': pd.Categorical.from_codes(
+                np.where(miss, -1, rows[:, 3]), categories=list(self._methods)),
+        }, index=index)
+
     def reload_data(self):
         """
         Force reload of calendar data from disk, bypassing cache.
@@ -117,23 +317,32 @@ class DatabaseLoader:
             'hijri': {'min': 1, 'max': 1500}
         }
         """
-        data = self.load_data()
-        # Get date range from multi-index levels
-        years = data.index.get_level_values('g_year')
-        date_ranges = {
-            'gregorian': {
-                'min': years.min(), 
-                'max': years.max()
-            },
-            'hijri': {
-                'min': data['h_year'].min(),
-                'max': data['h_year'].max()
-            }
-        }
-        return date_ranges
+        self.load_data()
+        # Computed once per load; copied so callers cannot alter the cache
+        return {calendar: dict(bounds) for calendar, bounds in self._ranges.items()}
     
     def __str__(self):
         return f"Date Database : Range ({self.date_ranges()})"
 
 
+@functools.lru_cache(maxsize=1)
+def get_loader() -> DatabaseLoader:
+    """
+    Return the process-wide DatabaseLoader, loading the data on first call.
+
+    All lookups should go through this instead of constructing
+    ``DatabaseLoader()`` directly, so the mapping table is loaded and
+    indexed once per process.
+
+    Examples
+    --------
+    >>> loader = get_loader()
+    >>> loader is get_loader()
+    True
+    """
+    return DatabaseLoader()
+
 
+def invalidate_loader():
+    """Drop the shared loader so the next ``get_loader()`` call reloads (e.g. in tests)."""
+    get_loader.cache_clear()
@@ -0,0 +1,121 @@
+import hashlib
+import os
+import zipfile
+
+import numpy as np
+import pandas as pd
+
+try:
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    from json import dumps as _dumps, loads as json_loads
+
+    def json_dumps(value):
+        return _dumps(value).encode("utf-8")
+
+# Directory of the parsed-frame cache. Off by default: set
+# HIJRI_DATETIME_FRAME_CACHE_DIR (or assign this attribute) to a per-user
+# directory such as ~/.cache/hijri_datetime/frames to opt in.
+CACHE_DIR = os.environ.get("HIJRI_DATETIME_FRAME_CACHE_DIR", "")
+
+# Suffix of the cached frame files; plain NumPy arrays, loaded without pickle
+CACHE_SUFFIX = ".npz"
+
+
+def _cache_path(source_path):
+    """Return the cache file for a source file, or None if caching is off."""
+    if not CACHE_DIR:
+        return None
+    digest = hashlib.sha1(os.path.abspath(source_path).encode("utf-8")).hexdigest()
+    return os.path.join(CACHE_DIR, digest + CACHE_SUFFIX)
+
+
+def _read_cached_frame(source_path, loader_path):
+    """
+    Load the pre-parsed DataFrame cached for a source file, if still fresh.
+
+    Parameters
+    ----------
+    source_path : str
+        Absolute path of the source CSV the cache was built from.
+    loader_path : str
+        Path of the module that parsed it; editing the parsing code
+        invalidates the cache just like editing the CSV.
+
+    Returns
+    -------
+    pandas.DataFrame or None
+        The cached DataFrame, or None if caching is off, there is no cache,
+        it is older than the source file or loader, or it cannot be read.
+    """
+    cache_path = _cache_path(source_path)
+    if cache_path is None:
+        return None
+    try:
+        cache_mtime = os.path.getmtime(cache_path)
+        if cache_mtime < os.path.getmtime(source_path) or cache_mtime < os.path.getmtime(loader_path):
+            return None
+        # allow_pickle=False: the file can only hold plain arrays, never code
+        with np.load(cache_path, allow_pickle=False) as data:
+            columns = {}
+            for i, (name, kind) in enumerate(zip(data["names"].tolist(), data["kinds"].tolist())):
+                values = data[f"c{i}"]
+                if kind == "category":
+                    columns[name] = pd.Categorical.from_codes(values, data[f"k{i}"].tolist())
+                elif kind == "json":
+                    columns[name] = [json_loads(v) for v in values.tolist()]
+                else:
+                    columns[name] = values
+            return pd.DataFrame(columns, index=data["index"])
+    except (OSError, KeyError, ValueError, zipfile.BadZipFile):
+        return None
+
+
+def _write_cached_frame(source_path, df):
+    """
+    Store a parsed DataFrame in the frame cache for faster reloads.
+
+    Best-effort: does nothing unless CACHE_DIR is set, and if the directory
+    cannot be written every load parses the source file instead.
+
+    Numeric and categorical columns are stored as NumPy arrays; any other
+    column is stored one JSON document per cell.
+
+    Parameters
+    ----------
+    source_path : str
+        Absolute path of the source CSV the DataFrame was built from.
+    df : pandas.DataFrame
+        Fully processed DataFrame to cache.
+    """
+    cache_path = _cache_path(source_path)
+    if cache_path is None:
+        return
+    arrays = {"names": np.array(df.columns, dtype=str), "index": df.index.to_numpy(np.int64)}
+    kinds = []
+    for i, name in enumerate(df.columns):
+        column = df[name]
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            kinds.append("category")
+            arrays[f"c{i}"] = column.cat.codes.to_numpy()
+            arrays[f"k{i}"] = np.array(column.cat.categories, dtype=str)
+        elif column.dtype.kind in "biuf":
+            kinds.append("plain")
+            arrays[f"c{i}"] = column.to_numpy()
+        else:
+            kinds.append("json")
+            arrays[f"c{i}"] = np.array([json_dumps(v).decode("utf-8") for v in column.tolist()], dtype=str)
+    arrays["kinds"] = np.array(kinds, dtype=str)
+
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        # Atomic rename so concurrent loaders never see a partial file
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
@@ -1,7 +1,15 @@
 import os
-import ast
 import pandas as pd
-from datetime import datetime
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+from ._frame_cache import _read_cached_frame, _write_cached_frame
+
+# dd-mm-yyyy as stored in the CSV
+_DMY_PATTERN = r"(0[1-9]|[12]\d|3[01])-(0[1-9]|1[0-2])-\d{4}$"
 
 # Default CSV file path relative to this module
 DEFAULT_CSV_PATH = "./date_dataset/calendar_date_holidays_dataset.csv.xz"
@@ -25,7 +33,8 @@ def _load_hijri_holydays(csv_path=DEFAULT_CSV_PATH):
     pandas.DataFrame
         Validated and cleaned calendar mapping data with proper data types.
         Contains columns for multiple calendar systems (Gregorian, Hijri, Solar Hijri)
-        and weekday information. Sorted by Gregorian date for consistent ordering.
+        and weekday information, plus integer g_day/g_month/g_year columns
+        split from gregorian_date. Sorted by Gregorian date for consistent ordering.
 
     Raises
     ------
@@ -67,27 +76,44 @@ def _load_hijri_holydays(csv_path=DEFAULT_CSV_PATH):
     if not os.access(file_path, os.R_OK):
         raise PermissionError(f"Cannot read calendar hijri holydays data file: {file_path}")
 
+    # Reuse the pre-parsed copy from an earlier run unless the CSV is newer
+    df = _read_cached_frame(file_path, __file__)
+    if df is not None:
+        return df
+
     try:
         # Load CSV with UTF-8 encoding to handle international characters
         print(f"Loading calendar hijri holydays data from: {file_path}")  # Using print since logger not imported
         df = pd.read_csv(file_path, encoding='utf-8', compression="xz")
 
-        #  Convert dd-mm-yyyy string → ISO yyyy-mm-dd string 
-        df["gregorian_date"] = df["gregorian_date"].apply(
-            lambda x: datetime.strptime(x, "%d-%m-%Y").strftime("%Y-%m-%d")
-        )
+        #  Convert dd-mm-yyyy string → ISO yyyy-mm-dd string by reordering the
+        #  fixed-width fields in vectorized string ops (years before 1677 are
+        #  outside the range pd.to_datetime supports on older pandas)
+        dates = df["gregorian_date"].astype(str)
+        if not dates.str.match(_DMY_PATTERN).all():
+            raise ValueError("gregorian_date values must be formatted as dd-mm-yyyy")
+        df["gregorian_date"] = dates.str[6:] + "-" + dates.str[3:5] + "-" + dates.str[:2]
+
+        # Integer date parts from one vectorized split, matching the mapping
+        # table's g_day/g_month/g_year columns for joins and numeric sorting
+        parts = dates.str.split("-", n=2, expand=True)
+        df["g_day"] = parts[0].astype("int8")
+        df["g_month"] = parts[1].astype("int8")
+        df["g_year"] = parts[2].astype("int16")
         
-        # Convert list-like strings to Python lists
-        df["hijri_holidays"] = df["hijri_holidays"].apply(ast.literal_eval)
-        df["hijri_adjustedHolidays"] = df["hijri_adjustedHolidays"].apply(ast.literal_eval)
+        # Convert the JSON-array strings to Python lists (one C-level parse
+        # per cell instead of compiling each cell as a Python literal)
+        for column in ("hijri_holidays", "hijri_adjustedHolidays"):
+            df[column] = [json_loads(v) if v else [] for v in df[column].to_numpy()]
         
-        # Sort by gregorian_date (or hijri_date)
-        df = df.sort_values(by="gregorian_date")
+        # Sort by Gregorian date (stable, on the integer parts rather than the string)
+        df = df.sort_values(by=["g_year", "g_month", "g_day"], kind="stable")
         
         df = df.reset_index(drop=True)
 
 
         print(f"Successfully processed {len(df):,} valid calendar mapping records")
+        _write_cached_frame(file_path, df)
         return df
 
     except pd.errors.EmptyDataError:
@@ -1,16 +1,58 @@
 """Core Hijri date and time classes."""
 
+import logging
 from datetime import date, datetime, time
 from typing import Optional, Union, Tuple
 import calendar
+from enum import IntEnum
+import numpy as np
 import pandas as pd
 
 from .exceptions import InvalidHijriDate
 from .constants import HIJRI_MONTHS, HIJRI_WEEKDAYS
 
-from hijri_datetime.data import DatabaseLoader
+from hijri_datetime.data import get_loader
 
-loader = DatabaseLoader()
+
+logger = logging.getLogger(__name__)
+
+
+class DKind(IntEnum):
+    """Precision of a date lookup."""
+    DATE = 1
+    MONTH_RANGE = 2
+    YEAR_RANGE = 3
+
+
+# Lookup precision by which of (year, month, day) are given; other combinations are invalid
+_DTYPE_MAP = {
+    (True, True, True): DKind.DATE,
+    (True, True, False): DKind.MONTH_RANGE,
+    (True, False, False): DKind.YEAR_RANGE,
+}
+
+
+def _key_bounds(year: int, month: Optional[int], day: Optional[int]) -> Tuple[int, int]:
+    """Return the inclusive packed-key range of a date, a whole month or a whole year."""
+    if day:
+        key = (year << 9) | (month << 5) | day
+        return key, key
+    if month:
+        key = (year << 9) | (month << 5)
+        return key, key | 31
+    key = year << 9
+    return key, key | 511
+
+
+def _lookup_rows(projected: pd.DataFrame, keys: np.ndarray, order: np.ndarray,
+                 year: int, month: Optional[int], day: Optional[int]) -> Optional[pd.DataFrame]:
+    """Binary-search the sorted packed keys and return the matching rows, or None."""
+    low, high = _key_bounds(year, month, day)
+    start = keys.searchsorted(low, side='left')
+    stop = keys.searchsorted(high, side='right')
+    if start == stop:
+        return None
+    return projected.iloc[order[start:stop]]
 
 '''
 def __init__(self, loader: DatabaseLoader): 
@@ -23,8 +65,11 @@ def __init__(self, loader: DatabaseLoader):
 
 class HijriDate:
     """Represents a Hijri calendar date."""
+
+    # Ranges can yield many instances; the mapping data lives on the shared loader
+    __slots__ = ("_h_year", "_h_month", "_h_day", "method", "dtype")
  
-    def init(self, year: int, month: int, day: int):
+    def __init__(self, year: int, month: int, day: int):
         """Initialize a Hijri date.
  
         Args:
@@ -33,31 +78,66 @@ class HijriDate:
             day: Hijri day (1-30)
  
         Raises:
-            InvalidHijriDate: If the date is invalid
-        """        
-        try:
-            # Load the calendar mapping data
-            self.db = loader._data            
-            self._data_loaded = True
-            self._date_ranges = loader.date_ranges()  # Initialize cache for date ranges
-            if not self._is_valid_date(year, month, day):
-                raise InvalidHijriDate(f"Invalid Hijri date: {year}-{month}-{day}")    
-        except Exception as e:
-            self._data_loaded = False
-            self.db = None
-            self._date_ranges = None
-            # Don't re-raise to allow graceful degradation   
-        
-        self.db = loader._data
-        self.selected_db = 
+            InvalidHijriDate: If the date is not in the dataset
+        """
+        # Range-check first: out-of-range parts would alias other packed keys
+        if not all(isinstance(part, int) for part in (year, month, day)) \
+                or not (1 <= month <= 12 and 1 <= day <= 30) \
+                or get_loader()._exact_rows(True, year, month, day) is None:
+            raise InvalidHijriDate(f"Invalid Hijri date: {year}-{month}-{day}")
         self._h_year = year
         self._h_month = month
         self._h_day = day
         self.method = None # Allowed: "HJCoSA" ┃ "UAQ" ┃ "DIYANET" ┃ "MATHEMATICAL"
-        self.dtype = None  # Allowed: "datetime" ┃ "date" ┃ "month_range" ┃ "year_range"
+        self.dtype = None  # Allowed: DKind.DATE ┃ DKind.MONTH_RANGE ┃ DKind.YEAR_RANGE
 
-    def _h_get_valid_dates(self, year: int, month: Optional[int], day: Optional[int]) -> Optional[pd.DataFrame]:
-        """Check if the given Hijri date is valid."""
+    @classmethod
+    def _quickinit(cls, year: int, month: int, day: int) -> "HijriDate":
+        """Build a HijriDate already known to be in the dataset, skipping validation."""
+        self = cls.__new__(cls)
+        self._h_year = year
+        self._h_month = month
+        self._h_day = day
+        self.method = None
+        self.dtype = None
+        return self
+
+    @property
+    def year(self) -> int:
+        return self._h_year
+ 
+    @property
+    def month(self) -> int:
+        return self._h_month
+ 
+    @property
+    def day(self) -> int:
+        return self._h_day
+
+    def _lookup(self, hijri: bool, year: int, month: Optional[int], day: Optional[int]) -> Optional[Union[pd.DataFrame, Tuple]]:
+        """Look up a Hijri (``hijri=True``) or Gregorian date, month or year in the database."""
+        self.dtype = self.get_dtype(year, month, day)
+        if self.dtype is None:
+            return None
+        loader = get_loader()
+        if self.dtype == DKind.DATE:
+            # Exact dates skip pandas: (day, month, year, hijri_method) tuples
+            info = loader._exact_rows(hijri, year, month, day)
+        elif hijri:
+            info = _lookup_rows(loader._h_projected, loader._h_keys, loader._h_order, year, month, day)
+        else:
+            info = _lookup_rows(loader._g_projected, loader._g_keys, loader._g_order, year, month, day)
+        if info is None:
+            logger.debug("%s date %s-%s-%s not available in dataset",
+                         "Hijri" if hijri else "Gregorian", year, month, day)
+        return info
+
+    def _h_get_valid_dates(self, year: int, month: Optional[int], day: Optional[int]) -> Optional[Union[pd.DataFrame, Tuple]]:
+        """Check if the given Hijri date is valid.
+
+        Returns a tuple of (g_day, g_month, g_year, hijri_method) rows for an
+        exact date, a DataFrame for a month or year range, or None.
+        """
         if not isinstance(year, int):
             return None
         if month and not (1 <= month <= 12):
@@ -66,34 +146,14 @@ class HijriDate:
             return None
         
         # Add more sophisticated validation here - checking database
-        self.dtype = self.get_dtype(year, month, day)
-        # Get Hijri equivalent
-        if self._data_loaded:
-            # Get all records
-            if self.dtype == "date":
-                try:
-                    hijri_info = self.db.loc[(year, month, day)][['h_day', 'h_month', 'h_year', 'hijri_method']]
-                    return hijri_info
-                except KeyError:
-                    print(f"   ℹ  Hijri date: {year}-{month}-{day} not available in dataset")
-            elif self.dtype == "month_range":
-                try:
-                    hijri_info = self.db.loc[(year, month, day)][['h_day', 'h_month', 'h_year', 'hijri_method']]
-                    return hijri_info
-                except KeyError:
-                    print(f"   ℹ  Hijri date: {year}-{month} not available in dataset")
-                    
-            elif self.dtype == "year_range":
-                try:
-                    hijri_info = self.db.loc[(year, month, day)][['h_day', 'h_month', 'h_year', 'hijri_method']]
-                    return hijri_info
-                except KeyError:
-                    print(f"   ℹ  Hijri date: {year} not available in dataset")
-                
-        return None
+        return self._lookup(True, year, month, day)
     
-    def _g_get_valid_dates(self, year: int, month: Optional[int], day: Optional[int]) -> Optional[pd.DataFrame]:
-        """Check if the given Gregorian date is valid."""
+    def _g_get_valid_dates(self, year: int, month: Optional[int], day: Optional[int]) -> Optional[Union[pd.DataFrame, Tuple]]:
+        """Check if the given Gregorian date is valid.
+
+        Returns a tuple of (h_day, h_month, h_year, hijri_method) rows for an
+        exact date, a DataFrame for a month or year range, or None.
+        """
         if not isinstance(year, int):
             return None
         if month and not (1 <= month <= 12):
@@ -102,42 +162,40 @@ class HijriDate:
             return None
         
         # Add more sophisticated validation here - checking database
-        self.dtype = self.get_dtype(year, month, day)
-        # Get Hijri equivalent
-        if self._data_loaded:
-            # Get all records
-            if self.dtype == "date":
-                try:
-                    hijri_info = self.db.loc[(year, month, day)][['h_day', 'h_month', 'h_year', 'hijri_method']]
-                    return hijri_info
-                except KeyError:
-                    print(f"   ℹ  Hijri date: {year}-{month}-{day} not available in dataset")
-            elif self.dtype == "month_range":
-                try:
-                    hijri_info = self.db.loc[(year, month, day)][['h_day', 'h_month', 'h_year', 'hijri_method']]
-                    return hijri_info
-                except KeyError:
-                    print(f"   ℹ  Hijri date: {year}-{month} not available in dataset")
-                    
-            elif self.dtype == "year_range":
-                try:
-                    hijri_info = self.db.loc[(year, month, day)][['h_day', 'h_month', 'h_year', 'hijri_method']]
-                    return hijri_info
-                except KeyError:
-                    print(f"   ℹ  Hijri date: {year} not available in dataset")
-                
-        return None
+        return self._lookup(False, year, month, day)
     
-    def get_dtype(self, year: int, month: Optional[int], day: Optional[int]):
-        Allowed= ["datetime", "date", "month_range", "year_range"]
-        if year and month and day:
-            return Allowed[1]
-        if year and month and not day:
-            return Allowed[2]
-        if year and not month and not day:
-            return Allowed[3]
-        
-        return None
+    @classmethod
+    def from_gregorian_batch(cls, years, months, days) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Convert arrays of Gregorian dates to Hijri without per-date Python work.
+
+        Args:
+            years: Gregorian years
+            months: Gregorian months (1-12)
+            days: Gregorian days (1-31)
+
+        Returns:
+            (h_year, h_month, h_day) int32 arrays; -1 marks dates not in the dataset
+        """
+        return get_loader()._probe_many(False, years, months, days)
+
+    @classmethod
+    def from_gregorian_arrays(cls, years, months, days) -> pd.DataFrame:
+        """Convert arrays of Gregorian dates to Hijri as one columnar DataFrame.
+
+        Args:
+            years: Gregorian years
+            months: Gregorian months (1-12)
+            days: Gregorian days (1-31)
+
+        Returns:
+            DataFrame indexed by (g_year, g_month, g_day) in input order, with
+            h_day, h_month, h_year and hijri_method columns; missing values
+            mark dates not in the dataset
+        """
+        return get_loader()._frame_many(False, years, months, days)
+
+    def get_dtype(self, year: int, month: Optional[int], day: Optional[int]) -> Optional[DKind]:
+        return _DTYPE_MAP.get((bool(year), bool(month), bool(day)))
  
     def __repr__(self) -> str:
         return f"datetime.date({self.year}, {self.month}, {self.day}, 'hijri')"
@@ -218,12 +276,17 @@ class HijriDateRange:
         return self.start <= date <= self.end
  
     def __iter__(self):
-        """Iterate over dates in the range."""
-        current = self.start
-        while current <= self.end:
-            yield current
-            # Add one day (simplified)
-            current = self._add_one_day(current)
+        """Iterate over the dataset's Hijri dates in the range."""
+        start, end = self.start, self.end
+        keys = get_loader()._h_keys
+        low = (start._h_year << 9) | (start._h_month << 5) | start._h_day
+        high = (end._h_year << 9) | (end._h_month << 5) | end._h_day
+        # One slice of the sorted packed keys; dates listed under several
+        # methods appear once. Every key is a known date, so skip validation.
+        span = np.unique(keys[keys.searchsorted(low, side='left'):keys.searchsorted(high, side='right')])
+        quickinit = HijriDate._quickinit
+        for key in span.tolist():
+            yield quickinit(key >> 9, (key >> 5) & 15, key & 31)
  
     def _add_one_day(self, date: HijriDate) -> HijriDate:
         """Add one day to a Hijri date (simplified implementation)."""
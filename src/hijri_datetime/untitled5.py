@@ -5,81 +5,243 @@ Created on Fri Sep 12 14:17:48 2025
 @author: m
 """
 
+import logging
+import numpy as np
 import pandas as pd
 from typing import Optional
 
-# Sample data for demonstration
-sample_data = {
-    'g_year': [2024, 2024, 2024, 2024, 2024, 2025, 2025, 2025],
-    'g_month': [1, 1, 1, 2, 2, 1, 1, 3],
-    'g_day': [15, 16, 17, 10, 11, 5, 6, 20],
-    'h_year': [1445, 1445, 1445, 1445, 1445, 1446, 1446, 1446],
-    'h_month': [7, 7, 7, 8, 8, 7, 7, 9],
-    'h_day': [4, 5, 6, 1, 2, 25, 26, 10],
-    'hijri_method': ['ISNA', 'ISNA', 'ISNA', 'ISNA', 'ISNA', 'ISNA', 'ISNA', 'ISNA']
+
+logger = logging.getLogger(__name__)
+
+
+def _load_sample():
+    """Return the sample date mappings used for demonstration."""
+    return pd.DataFrame({
+        'g_year': [2024, 2024, 2024, 2024, 2024, 2025, 2025, 2025],
+        'g_month': [1, 1, 1, 2, 2, 1, 1, 3],
+        'g_day': [15, 16, 17, 10, 11, 5, 6, 20],
+        'h_year': [1445, 1445, 1445, 1445, 1445, 1446, 1446, 1446],
+        'h_month': [7, 7, 7, 8, 8, 7, 7, 9],
+        'h_day': [4, 5, 6, 1, 2, 25, 26, 10],
+        'hijri_method': ['ISNA', 'ISNA', 'ISNA', 'ISNA', 'ISNA', 'ISNA', 'ISNA', 'ISNA']
+    })
+
+
+def _sorted_keys(years, months, days):
+    """
+    Pack (year, month, day) columns into int32 keys and sort them once.
+
+    The day takes the low 5 bits and the month the next 4, so keys order
+    chronologically and a whole month or year is one contiguous key range.
+    Returns (sorted keys, row positions in that order).
+    """
+    keys = ((years.astype(np.int32) << 9)
+            | (months.astype(np.int32) << 5)
+            | days.astype(np.int32))
+    order = np.argsort(keys, kind='stable')
+    return keys[order], order
+
+
+def _date_groups(keys, order):
+    """Map every (year, month, day) in the sorted keys to its row positions."""
+    if not len(keys):
+        return {}
+    # Each run of equal keys is one date; stable sorting kept its rows in row order
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    return {
+        (key >> 9, (key >> 5) & 15, key & 31): positions
+        for key, positions in zip(keys[starts].tolist(), np.split(order, starts[1:]))
+    }
+
+
+# Query precision by which of (year, month, day) are given; a day without
+# a month is ignored, and anything without a year is "invalid"
+_DTYPES = {
+    (True, True, True): "date",
+    (True, True, False): "month_range",
+    (True, False, True): "year_range",
+    (True, False, False): "year_range",
 }
 
+
+# Inclusive packed-key range of a query by precision, or None if it cannot
+# match; months/days outside their bit widths would alias a neighbouring key
+def _date_bounds(year, month, day):
+    if not (0 <= month < 16 and 0 <= day < 32):
+        return None
+    key = (year << 9) | (month << 5) | day
+    return key, key
+
+
+def _month_bounds(year, month, day):
+    if not 0 <= month < 16:
+        return None
+    key = (year << 9) | (month << 5)
+    return key, key | 31
+
+
+def _year_bounds(year, month, day):
+    key = year << 9
+    return key, key | 511
+
+
+# Narrowest type of each date column: years fit int16, months/days int8
+_COLUMN_TYPES = {
+    'g_year': np.int16, 'g_month': np.int8, 'g_day': np.int8,
+    'h_year': np.int16, 'h_month': np.int8, 'h_day': np.int8,
+}
+
+# Month/year range results memoized per calendar, evicted oldest-first
+_RANGE_CACHE_SIZE = 1024
+
+_KEY_BOUNDS = {
+    "date": _date_bounds,
+    "month_range": _month_bounds,
+    "year_range": _year_bounds,
+}
+
+
+def _search_range(keys, year, month, day):
+    """
+    Binary-search the sorted keys for a query.
+
+    Returns (lo, hi), the slice of keys the query matches, or None for an
+    invalid query.
+    """
+    dtype = _DTYPES.get((year is not None, month is not None, day is not None), "invalid")
+    bounds_fn = _KEY_BOUNDS.get(dtype)
+    if bounds_fn is None:
+        return None
+    bounds = bounds_fn(year, month, day)
+    if bounds is None:
+        return 0, 0
+    return (np.searchsorted(keys, bounds[0], 'left'),
+            np.searchsorted(keys, bounds[1], 'right'))
+
+
 class HijriDateMapper:
-    def __init__(self, data=None):
+    def __init__(self, data=None, verbose: bool = False):
         if data is None:
-            self.df = pd.DataFrame(sample_data)
+            # Only built when no data is given, not on import
+            self.df = _load_sample()
         else:
             self.df = data
-        print(f"Loaded {len(self.df)} date mappings")
-        print("Sample data:")
-        print(self.df.head())
+        # Narrow the date columns to the types used for lookups, and store the
+        # few distinct method names as a category
+        self.df = self.df.astype(_COLUMN_TYPES)
+        if 'hijri_method' in self.df.columns:
+            self.df['hijri_method'] = self.df['hijri_method'].astype('category')
+        # Date columns as narrow plain arrays (struct of arrays): lookups run
+        # on these and only touch the DataFrame to gather result rows
+        self._cols = {name: self.df[name].to_numpy().astype(np_type, copy=False)
+                      for name, np_type in _COLUMN_TYPES.items()}
+        cols = self._cols
+        # Sorted packed keys per calendar: any date, month or year query is
+        # two binary searches instead of a scan over every row
+        self._g_keys, self._g_order = _sorted_keys(cols['g_year'], cols['g_month'], cols['g_day'])
+        self._h_keys, self._h_order = _sorted_keys(cols['h_year'], cols['h_month'], cols['h_day'])
+        # Row positions per query and calendar: every exact date up front,
+        # and a bounded memo of the month and year ranges that matched
+        self._greg_groups = _date_groups(self._g_keys, self._g_order)
+        self._hijri_groups = _date_groups(self._h_keys, self._h_order)
+        self._greg_ranges = {}
+        self._hijri_ranges = {}
+        # Index labels as a plain array, or None when they equal the row
+        # positions (a default RangeIndex) and need no lookup at all
+        index = self.df.index
+        if isinstance(index, pd.RangeIndex) and index.start == 0 and index.step == 1:
+            self._labels = None
+        else:
+            self._labels = index.to_numpy()
+        # Whether the rows are already in key order, so a key slice's first
+        # and last rows are its first and last positions
+        self._g_in_order = bool(np.all(self._g_order[1:] > self._g_order[:-1]))
+        self._h_in_order = bool(np.all(self._h_order[1:] > self._h_order[:-1]))
+        if verbose:
+            print(f"Loaded {len(self.df)} date mappings")
+            print("Sample data:")
+            print(self.df.head())
     
     def get_dtype(self, year: int, month: Optional[int], day: Optional[int]):
         """Determine the precision level of the date query."""
-        if year is not None and month is not None and day is not None:
-            return "date"
-        elif year is not None and month is not None:
-            return "month_range"  
-        elif year is not None:
-            return "year_range"
-        else:
-            return "invalid"
+        return _DTYPES.get((year is not None, month is not None, day is not None), "invalid")
     
-    def to_hijri(self, year: int, month: Optional[int], day: Optional[int]):
+    def _label(self, position):
+        """Return the index label of the row at a position."""
+        labels = self._labels
+        return int(position) if labels is None else labels[position]
+    
+    def _lookup(self, date_type: str, year: int, month: Optional[int], day: Optional[int]):
         """
-        Convert Gregorian date to Hijri equivalent with index tracking.
+        Shared core of to_hijri, to_greg and get_match_indexes.
         
         Returns
         -------
-        tuple
-            (result_df, first_index, span) where:
-            - result_df: pd.DataFrame with Hijri dates
-            - first_index: int or None, DataFrame index of first match
-            - span: int, number of rows spanned (last_index - first_index)
+        np.ndarray or None
+            Row positions matching the query on the Gregorian or Hijri
+            columns, in row order, or None for an invalid query.
         """
-        dtype = self.get_dtype(year, month, day)
-        
-        if dtype == "date":
-            mask = ((self.df['g_year'] == year) & 
-                    (self.df['g_month'] == month) & 
-                    (self.df['g_day'] == day))
-            result = self.df[mask]
-        elif dtype == "month_range":
-            mask = ((self.df['g_year'] == year) & 
-                    (self.df['g_month'] == month))
-            result = self.df[mask]
-        elif dtype == "year_range":
-            mask = (self.df['g_year'] == year)
-            result = self.df[mask]
-        else:
+        if date_type == 'gregorian':
+            keys, order, groups, ranges = self._g_keys, self._g_order, self._greg_groups, self._greg_ranges
+        else:  # hijri
+            keys, order, groups, ranges = self._h_keys, self._h_order, self._hijri_groups, self._hijri_ranges
+        query = (year, month, day)
+        pos = groups.get(query)
+        if pos is None:
+            pos = ranges.get(query)
+        if pos is not None:
+            return pos
+        if year is not None and month is not None and day is not None:
+            # Every date in the data is already in groups
+            return order[:0]
+        span = _search_range(keys, year, month, day)
+        if span is None:
+            return None
+        lo, hi = span
+        # Keep matches in row order, as a mask scan would
+        pos = np.sort(order[lo:hi])
+        # Misses are cheap to recompute and unbounded in variety, so only hits are kept
+        if len(pos):
+            if len(ranges) >= _RANGE_CACHE_SIZE:
+                ranges.pop(next(iter(ranges)), None)
+            ranges[query] = pos
+        return pos
+    
+    def _convert(self, date_type: str, year: int, month: Optional[int], day: Optional[int]):
+        """Shared body of to_hijri/to_greg: matching rows, first index and span."""
+        pos = self._lookup(date_type, year, month, day)
+        if pos is None:
             result = pd.DataFrame()
+        else:
+            result = self.df.take(pos)
         
         if result.empty:
             first_index = None
             span = 0
-            print(f"   ℹ  Hijri date for Gregorian {year}-{month}-{day} not available in dataset")
+            if date_type == 'gregorian':
+                logger.debug("Hijri date for Gregorian %s-%s-%s not available in dataset", year, month, day)
+            else:
+                logger.debug("Gregorian date for Hijri %s-%s-%s not available in dataset", year, month, day)
         else:
-            first_index = result.index[0]
-            last_index = result.index[-1]
+            first_index, last_index = self._label(pos[0]), self._label(pos[-1])
             span = last_index - first_index
         
         return result, first_index, span
     
+    def to_hijri(self, year: int, month: Optional[int], day: Optional[int]):
+        """
+        Convert Gregorian date to Hijri equivalent with index tracking.
+        
+        Returns
+        -------
+        tuple
+            (result_df, first_index, span) where:
+            - result_df: pd.DataFrame with Hijri dates
+            - first_index: int or None, DataFrame index of first match
+            - span: int, number of rows spanned (last_index - first_index)
+        """
+        return self._convert('gregorian', year, month, day)
+    
     def to_greg(self, year: int, month: Optional[int], day: Optional[int]):
         """
         Convert Hijri date to Gregorian equivalent with index tracking.
@@ -92,61 +254,98 @@ class HijriDateMapper:
             - first_index: int or None, DataFrame index of first match
             - span: int, number of rows spanned (last_index - first_index)
         """
-        dtype = self.get_dtype(year, month, day)
-        
-        if dtype == "date":
-            mask = ((self.df['h_year'] == year) &
-                    (self.df['h_month'] == month) &
-                    (self.df['h_day'] == day))
-            result = self.df[mask]
-        elif dtype == "month_range":
-            mask = ((self.df['h_year'] == year) &
-                    (self.df['h_month'] == month))
-            result = self.df[mask]
-        elif dtype == "year_range":
-            mask = (self.df['h_year'] == year)
-            result = self.df[mask]
-        else:
-            result = pd.DataFrame()
-        
-        if result.empty:
-            first_index = None
-            span = 0
-            print(f"   ℹ  Gregorian date for Hijri {year}-{month}-{day} not available in dataset")
-        else:
-            first_index = result.index[0]
-            last_index = result.index[-1]
-            span = last_index - first_index
-        
-        return result, first_index, span
+        return self._convert('hijri', year, month, day)
     
     def get_match_indexes(self, year: int, month: Optional[int], day: Optional[int], date_type: str = 'gregorian'):
         """Get only the indexes and count without loading full data."""
-        dtype = self.get_dtype(year, month, day)
-        
         if date_type == 'gregorian':
-            year_col, month_col, day_col = 'g_year', 'g_month', 'g_day'
+            keys, order, groups, in_order = self._g_keys, self._g_order, self._greg_groups, self._g_in_order
         else:  # hijri
-            year_col, month_col, day_col = 'h_year', 'h_month', 'h_day'
+            keys, order, groups, in_order = self._h_keys, self._h_order, self._hijri_groups, self._h_in_order
         
-        if dtype == "date":
-            mask = ((self.df[year_col] == year) & 
-                    (self.df[month_col] == month) & 
-                    (self.df[day_col] == day))
-        elif dtype == "month_range":
-            mask = ((self.df[year_col] == year) & 
-                    (self.df[month_col] == month))
-        elif dtype == "year_range":
-            mask = (self.df[year_col] == year)
-        else:
-            return None, None, 0
-        
-        matching_indexes = self.df.index[mask]
+        pos = groups.get((year, month, day))
+        if pos is not None:
+            if len(pos) == 0:
+                return None, None, 0
+            return self._label(pos[0]), self._label(pos[-1]), len(pos)
         
-        if len(matching_indexes) == 0:
+        # Two probes of the sorted keys; no positions array is built
+        span = _search_range(keys, year, month, day)
+        if span is None or span[0] == span[1]:
             return None, None, 0
+        lo, hi = span
+        if in_order:
+            first, last = order[lo], order[hi - 1]
         else:
-            return matching_indexes[0], matching_indexes[-1], len(matching_indexes)
+            matched = order[lo:hi]
+            first, last = matched.min(), matched.max()
+        return self._label(first), self._label(last), int(hi - lo)
+
+    def _convert_batch(self, date_type: str, years, months, days):
+        """Shared body of to_hijri_batch/to_greg_batch."""
+        if date_type == 'gregorian':
+            keys, order = self._g_keys, self._g_order
+        else:  # hijri
+            keys, order = self._h_keys, self._h_order
+        years = pd.array(years, dtype='Int64')
+        n = len(years)
+        months = pd.array([None] * n if months is None else months, dtype='Int64')
+        days = pd.array([None] * n if days is None else days, dtype='Int64')
+        
+        # Same precedence as get_dtype: a day only counts together with a month
+        has_month = ~months.isna()
+        is_date = has_month & ~days.isna()
+        y = years.to_numpy(dtype=np.int64, na_value=0)
+        m = np.where(has_month, months.to_numpy(dtype=np.int64, na_value=0), 0)
+        d = np.where(is_date, days.to_numpy(dtype=np.int64, na_value=0), 0)
+        # Months/days outside their bit widths would alias a neighbouring key
+        valid = ~years.isna() & (m >= 0) & (m < 16) & (d >= 0) & (d < 32)
+        
+        # Key range of every query at once, as _KEY_BOUNDS computes them one by one
+        lo_key = (y << 9) | (m << 5) | d
+        hi_key = lo_key | np.where(is_date, 0, np.where(has_month, 31, 511))
+        lo = np.searchsorted(keys, lo_key, 'left')
+        hi = np.searchsorted(keys, hi_key, 'right')
+        counts = np.where(valid, hi - lo, 0)
+        
+        # Concatenate the key slices of all queries without a Python loop
+        ends = np.cumsum(counts)
+        offsets = np.arange(ends[-1] if n else 0) - np.repeat(ends - counts, counts)
+        result = self.df.take(order[np.repeat(lo, counts) + offsets])
+        result['query'] = np.repeat(np.arange(n), counts)
+        return result
+    
+    def to_hijri_batch(self, years, months=None, days=None):
+        """
+        Convert many Gregorian queries to Hijri in one vectorized pass.
+        
+        Each query is an exact date, a month (day missing) or a year (month
+        and day missing), as for to_hijri; missing parts are None or NaN.
+        
+        Returns
+        -------
+        pd.DataFrame
+            The matching rows of all queries in query order, each query's
+            rows in date order, with a ``query`` column holding the position
+            of the query they answer. Queries without a match add no rows.
+        """
+        return self._convert_batch('gregorian', years, months, days)
+    
+    def to_greg_batch(self, years, months=None, days=None):
+        """
+        Convert many Hijri queries to Gregorian in one vectorized pass.
+        
+        Each query is an exact date, a month (day missing) or a year (month
+        and day missing), as for to_greg; missing parts are None or NaN.
+        
+        Returns
+        -------
+        pd.DataFrame
+            The matching rows of all queries in query order, each query's
+            rows in date order, with a ``query`` column holding the position
+            of the query they answer. Queries without a match add no rows.
+        """
+        return self._convert_batch('hijri', years, months, days)
 
 # =============================================================================
 # USAGE EXAMPLES
@@ -154,7 +353,7 @@ class HijriDateMapper:
 
 def main():
     # Initialize the mapper
-    mapper = HijriDateMapper()
+    mapper = HijriDateMapper(verbose=True)
     
     print("\n" + "="*80)
     print("EXAMPLE 1: Convert Specific Gregorian Date to Hijri")
@@ -273,12 +472,13 @@ def main():
         (2025, None, None), # Whole year
     ]
     
+    # Only positions and counts are reported, so skip building result frames
     results = []
     for year, month, day in queries:
-        hijri_df, first_idx, last_idx = mapper.to_hijri(year, month, day)
+        first_idx, last_idx, count = mapper.get_match_indexes(year, month, day, 'gregorian')
         results.append({
             'query': f"{year}-{month}-{day}",
-            'matches': len(hijri_df),
+            'matches': count,
             'first_index': first_idx,
             'last_index': last_idx,
             'span': last_idx - first_idx + 1 if first_idx is not None else 0
@@ -296,7 +496,7 @@ def main():
 
 def run_examples():
     print("🚀 Initializing Hijri Date Mapper...")
-    mapper = HijriDateMapper()
+    mapper = HijriDateMapper(verbose=True)
     
     print("\n" + "="*70)
     print("EXAMPLE 1: Single Date Conversion with Span")
@@ -1,8 +1,22 @@
 """Pytest configuration and fixtures."""
 
+import pandas as pd
 import pytest
 from datetime import date
 from hijri_datetime import HijriDate, HijriDateTime
+from hijri_datetime.data import date_loader
+
+
+# Small mapping table standing in for the bundled calendar CSV
+MAPPING = pd.DataFrame({
+    'g_day': [15, 16, 31, 1],
+    'g_month': [1, 1, 12, 1],
+    'g_year': [2024, 2024, 2024, 2025],
+    'h_day': [3, 4, 29, 1],
+    'h_month': [7, 7, 6, 7],
+    'h_year': [1445, 1445, 1446, 1446],
+    'hijri_method': ['HJCoSA', 'HJCoSA', 'HJCoSA', 'HJCoSA'],
+})
 
 
 @pytest.fixture
@@ -20,4 +34,14 @@ def sample_hijri_datetime():
 @pytest.fixture
 def sample_gregorian_date():
     """Sample Gregorian date for testing."""
-    return date(2023, 11, 28)
\ No newline at end of file
+    return date(2023, 11, 28)
+
+
+@pytest.fixture
+def mapping_data(monkeypatch):
+    """Serve MAPPING instead of the CSV to every loader, including get_loader()."""
+    data = MAPPING.copy()
+    monkeypatch.setattr(date_loader, '_load_mapping_data', lambda: data.copy())
+    date_loader.invalidate_loader()
+    yield data
+    date_loader.invalidate_loader()
@@ -0,0 +1,30 @@
+"""Tests for the build-artifact sweep in clean_build_dirs.py."""
+
+import importlib.util
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "clean_build_dirs.py"
+
+
+def load_script():
+    spec = importlib.util.spec_from_file_location("clean_build_dirs", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+cbd = load_script()
+
+
+def test_find_dirs_skips_matches_and_their_contents(tmp_path):
+    (tmp_path / "pkg" / "__pycache__" / "__pycache__").mkdir(parents=True)
+    (tmp_path / "pkg" / "sub" / "__pycache__").mkdir(parents=True)
+    found = cbd._find_dirs(str(tmp_path), lambda name: name == "__pycache__")
+    assert sorted(found) == sorted([
+        str(tmp_path / "pkg" / "__pycache__"),
+        str(tmp_path / "pkg" / "sub" / "__pycache__"),
+    ])
+
+
+def test_find_dirs_skips_unreadable_directories(tmp_path):
+    assert cbd._find_dirs(str(tmp_path / "missing"), lambda name: True) == []
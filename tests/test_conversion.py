@@ -0,0 +1,82 @@
+"""Tests for DateMapping Gregorian <-> Hijri lookups."""
+
+import pandas as pd
+import pytest
+
+from hijri_datetime.conversion import (
+    DTYPE_DATE,
+    DTYPE_MONTH,
+    DTYPE_YEAR,
+    DateMapping,
+)
+from hijri_datetime.data.utils._load_mapping_data import COLUMN_DTYPES
+
+
+class StubLoader:
+    """Minimal stand-in for DatabaseLoader exposing a prepared frame."""
+
+    def __init__(self, data):
+        self._data = data
+
+
+@pytest.fixture
+def mapper():
+    """DateMapping over a three-row mapping table."""
+    data = pd.DataFrame({
+        'g_day': [15, 16, 11],
+        'g_month': [1, 1, 3],
+        'g_year': [2024, 2024, 2024],
+        'h_day': [3, 4, 1],
+        'h_month': [7, 7, 9],
+        'h_year': [1445, 1445, 1445],
+        'hijri_method': ['HJCoSA', 'HJCoSA', 'HJCoSA'],
+    })
+    return DateMapping(StubLoader(data))
+
+
+def test_columns_use_loader_dtypes(mapper):
+    assert {name: str(dtype) for name, dtype in mapper.df.dtypes.items()} == COLUMN_DTYPES
+
+
+def test_get_dtype(mapper):
+    assert mapper.get_dtype(2024, 1, 15) == DTYPE_DATE
+    assert mapper.get_dtype(2024, 1, None) == DTYPE_MONTH
+    assert mapper.get_dtype(2024, None, None) == DTYPE_YEAR
+    assert mapper.get_dtype(2024, None, 15) is None
+    assert mapper.get_dtype(None, 1, 15) is None
+
+
+def test_to_hijri_exact_date(mapper):
+    result = mapper.to_hijri(2024, 1, 15)
+    assert len(result) == 1
+    row = result.iloc[0]
+    assert (row['h_year'], row['h_month'], row['h_day']) == (1445, 7, 3)
+
+
+def test_to_greg_exact_date(mapper):
+    result = mapper.to_greg(1445, 7, 4)
+    assert len(result) == 1
+    row = result.iloc[0]
+    assert (row['g_year'], row['g_month'], row['g_day']) == (2024, 1, 16)
+
+
+def test_ranges(mapper):
+    assert len(mapper.to_hijri(2024, 1, None)) == 2
+    assert len(mapper.to_hijri(2024, None, None)) == 3
+    assert len(mapper.to_greg(1445, 7, None)) == 2
+    assert len(mapper.to_greg(1445, None, None)) == 3
+
+
+def test_missing_dates_return_empty_frame(mapper):
+    assert mapper.to_hijri(2024, 2, 1).empty
+    assert mapper.to_greg(1446, 1, 1).empty
+    assert mapper.to_greg(None, None, None).empty
+
+
+def test_bulk_lookups_keep_query_order(mapper):
+    greg = mapper.to_greg_many([1445, 1446, 1445], [9, 1, 7], [1, 1, 3])
+    assert list(greg.index) == [(1445, 9, 1), (1445, 7, 3)]
+    assert list(greg['g_day']) == [11, 15]
+
+    hijri = mapper.to_hijri_many([2024, 2024], [1, 3], [16, 11])
+    assert list(hijri['h_day']) == [4, 1]
@@ -0,0 +1,33 @@
+"""Tests for HijriDate lookups against the mapping data."""
+
+import logging
+
+import pandas as pd
+
+from hijri_datetime.date import HijriDate
+
+
+def test_from_gregorian_batch(mapping_data):
+    years, months, days = HijriDate.from_gregorian_batch([2024, 2024, 2024], [1, 17, 2], [15, 1, 33])
+    assert years.tolist() == [1445, -1, -1]
+    assert months.tolist() == [7, -1, -1]
+    assert days.tolist() == [3, -1, -1]
+
+
+def test_from_gregorian_arrays(mapping_data):
+    frame = HijriDate.from_gregorian_arrays([2024, 2030, 2024], [12, 1, 17], [31, 1, 1])
+    assert list(frame.index) == [(2024, 12, 31), (2030, 1, 1), (2024, 17, 1)]
+    assert list(frame.columns) == ['h_day', 'h_month', 'h_year', 'hijri_method']
+    first = frame.iloc[0]
+    assert (first['h_year'], first['h_month'], first['h_day']) == (1446, 6, 29)
+    assert first['hijri_method'] == 'HJCoSA'
+    # A missing date and an invalid one (month 17 would alias 2025-01-01)
+    assert frame.iloc[1:].isna().all(axis=None)
+
+
+def test_lookup_miss_is_logged_not_printed(mapping_data, caplog, capsys):
+    date = HijriDate(1445, 7, 3)
+    with caplog.at_level(logging.DEBUG, logger='hijri_datetime.date'):
+        assert date._h_get_valid_dates(1445, 8, 1) is None
+    assert capsys.readouterr().out == ''
+    assert 'Hijri date 1445-8-1 not available' in caplog.text
@@ -0,0 +1,52 @@
+"""Tests for DatabaseLoader's vectorized date lookups."""
+
+import pytest
+
+from hijri_datetime.data import date_loader
+from hijri_datetime.data.date_loader import DatabaseLoader
+
+
+@pytest.fixture
+def loader(mapping_data):
+    return DatabaseLoader()
+
+
+def test_probe_many_converts_and_marks_misses(loader):
+    years, months, days = loader._probe_many(False, [2024, 2025, 2030], [1, 1, 1], [16, 1, 1])
+    assert years.tolist() == [1445, 1446, -1]
+    assert months.tolist() == [7, 7, -1]
+    assert days.tolist() == [4, 1, -1]
+
+
+def test_probe_many_rejects_out_of_range_parts(loader):
+    # Month 13 of 2024 packs like January 2025 and day 32 of a month like
+    # the 0th of the next; neither may alias onto a real date
+    years, months, days = loader._probe_many(
+        False, [2024, 2024, 2024, -1], [13, 12, 0, 1], [1, 32, 15, 15])
+    assert years.tolist() == [-1, -1, -1, -1]
+    assert months.tolist() == [-1, -1, -1, -1]
+    assert days.tolist() == [-1, -1, -1, -1]
+
+
+def test_probe_many_on_empty_table(monkeypatch, mapping_data):
+    monkeypatch.setattr(date_loader, '_load_mapping_data', lambda: mapping_data.iloc[:0].copy())
+    loader = DatabaseLoader()
+    years, months, days = loader._probe_many(True, [1445], [7], [3])
+    assert years.tolist() == [-1]
+    assert months.tolist() == [-1]
+    assert days.tolist() == [-1]
+    assert loader.date_ranges()['hijri'] == {'min': None, 'max': None}
+
+
+def test_exact_rows_memoizes(loader):
+    rows = loader._exact_rows(True, 1445, 7, 3)
+    assert rows == ((15, 1, 2024, 'HJCoSA'),)
+    assert loader._exact_rows(True, 1445, 7, 3) is rows
+    assert loader._exact_rows(True, 1445, 7, 5) is None
+
+
+def test_get_loader_is_shared(mapping_data):
+    loader = date_loader.get_loader()
+    assert date_loader.get_loader() is loader
+    date_loader.invalidate_loader()
+    assert date_loader.get_loader() is not loader
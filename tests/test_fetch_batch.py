@@ -0,0 +1,56 @@
+"""Tests for the concurrent ``*_batch`` Aladhan fetchers (network mocked)."""
+
+import pytest
+
+from hijri_datetime.api.aladhan import _http
+from hijri_datetime.api.aladhan.get.fetch_gregorian_data import fetch_gregorian_data_batch
+from hijri_datetime.api.aladhan.get.fetch_gregorian_month_data import fetch_gregorian_month_data_batch
+from hijri_datetime.api.aladhan.get.fetch_hijri_data import fetch_hijri_data_batch
+from hijri_datetime.api.aladhan.get.fetch_hijri_month_data import fetch_hijri_month_data_batch
+
+
+@pytest.fixture
+def sent(monkeypatch):
+    """Answer every request with its own URL, recording each batch sent."""
+    batches = []
+
+    def fetch_concurrently(urls, labels):
+        batches.append(list(urls))
+        results = []
+        for url in urls:
+            body = b'{"code": 200, "data": "%s"}' % url.encode()
+            data = _http.json_loads(body)
+            _http.cache_put(url, body, data)
+            results.append(data)
+        return results
+
+    monkeypatch.setattr(_http, '_fetch_concurrently', fetch_concurrently)
+    monkeypatch.setattr(_http, '_MEMORY_CACHE', {})
+    monkeypatch.setattr(_http, 'CACHE_DIR', '')
+    return batches
+
+
+@pytest.mark.parametrize("fetch, inputs, path", [
+    (fetch_hijri_data_batch, ["01-01-2024", "15-06-2024"], "/gToH/"),
+    (fetch_gregorian_data_batch, ["01-07-1445", "09-12-1445"], "/hToG/"),
+    (fetch_gregorian_month_data_batch, ["09-1445", "10-1445"], "/hToGCalendar/"),
+    (fetch_hijri_month_data_batch, [(9, 1445), (10, 1445)], "/hToGCalendar/"),
+])
+def test_batch_keeps_input_order(sent, fetch, inputs, path):
+    results = fetch(inputs)
+    assert len(results) == 2 and all(path in r['data'] for r in results)
+    assert [r['data'] for r in results] == sent[0]
+
+
+def test_invalid_inputs_are_not_sent(sent):
+    results = fetch_hijri_data_batch(["01-01-2024", "31-02-x", "not a date"])
+    assert results[1:] == [None, None]
+    assert len(sent) == 1 and len(sent[0]) == 1
+
+
+def test_cached_urls_are_not_requested_again(sent):
+    first = fetch_hijri_data_batch(["01-01-2024"])
+    second = fetch_hijri_data_batch(["01-01-2024", "02-01-2024"])
+    assert second[0] == first[0] and second[0] is not first[0]
+    assert [len(batch) for batch in sent] == [1, 1]
+    assert fetch_hijri_data_batch(["02-01-2024"]) and len(sent) == 2
@@ -0,0 +1,72 @@
+"""Tests for the month coalescing in the Gregorian -> Hijri fetchers (HTTP mocked)."""
+
+import pytest
+
+from hijri_datetime.api.aladhan.get import fetch_hijri_data as module
+
+
+def day_entry(day, month, year):
+    return {'gregorian': {'date': f"{day:02d}-{month:02d}-{year}"}, 'hijri': {'date': 'x'}}
+
+
+@pytest.fixture
+def requested(monkeypatch):
+    """Record every URL sent to the API and answer with canned data."""
+    urls = []
+
+    def get_json(url, label, headers=None):
+        urls.append(url)
+        if '/gToHCalendar/' in url:
+            month, year = map(int, url.split('?')[0].split('/')[-2:])
+            return {'code': 200, 'data': [day_entry(d, month, year) for d in range(1, 29)]}
+        return {'code': 200, 'data': day_entry(*map(int, label.split('-')))}
+
+    monkeypatch.setattr(module, 'get_json', get_json)
+    monkeypatch.setattr(module, '_MONTH_INDEX', {})
+    monkeypatch.setattr(module, '_MONTH_HITS', {})
+    return urls
+
+
+def test_repeating_one_date_does_not_fetch_the_month(requested):
+    for _ in range(5):
+        module.fetch_hijri_data("15-03-2024")
+    assert not any('/gToHCalendar/' in url for url in requested)
+
+
+def test_distinct_days_fetch_the_month_once(requested):
+    for day in range(1, 6):
+        result = module.fetch_hijri_data(f"{day:02d}-03-2024")
+        assert result['data']['gregorian']['date'] == f"{day:02d}-03-2024"
+    assert sum('/gToHCalendar/' in url for url in requested) == 1
+    assert len(requested) == module._MONTH_BATCH_MIN_DAYS
+
+
+def test_month_tables_are_bounded(requested, monkeypatch):
+    monkeypatch.setattr(module, '_MONTH_CACHE_SIZE', 2)
+    for year in (2020, 2021, 2022):
+        module.fetch_hijri_data(f"01-01-{year}")
+        module.fetch_hijri_dates([f"{day:02d}-02-{year}" for day in (1, 2, 3)])
+    assert list(module._MONTH_HITS) == [(1, 2021), (1, 2022)]
+    assert list(module._MONTH_INDEX) == [(2, 2021), (2, 2022)]
+
+
+def test_month_lookups_return_copies(requested):
+    for day in range(1, 4):
+        module.fetch_hijri_data(f"{day:02d}-03-2024")
+    first = module.fetch_hijri_data("02-03-2024")
+    first['data']['hijri']['date'] = 'changed'
+    first['data']['gregorian'].clear()
+    again = module.fetch_hijri_data("02-03-2024")
+    assert again['data'] == day_entry(2, 3, 2024)
+    assert sum('/gToHCalendar/' in url for url in requested) == 1
+
+
+def test_fetch_hijri_dates_returns_copies(requested):
+    dates = [f"{day:02d}-04-2024" for day in (1, 2, 3, 2)]
+    results = module.fetch_hijri_dates(dates)
+    assert list(results) == dates[:3]
+    results["02-04-2024"]['data']['hijri']['date'] = 'changed'
+    again = module.fetch_hijri_dates(["02-04-2024"])
+    assert again["02-04-2024"]['data'] == day_entry(2, 4, 2024)
+    assert module.fetch_hijri_data("02-04-2024")['data'] == day_entry(2, 4, 2024)
+    assert sum('/gToHCalendar/' in url for url in requested) == 1
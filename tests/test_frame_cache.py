@@ -0,0 +1,43 @@
+"""Tests for the opt-in parsed-frame cache."""
+
+import pandas as pd
+
+from hijri_datetime.data.utils import _frame_cache
+
+
+def make_frame():
+    return pd.DataFrame({
+        'g_day': pd.array([15, 16], dtype='int8'),
+        'hijri_method': pd.Categorical(['HJCoSA', 'UAQ']),
+        'hijri_holidays': [['Lailat-ul-Miraj'], []],
+    }, index=[3, 1])
+
+
+def test_cache_is_off_by_default(tmp_path, monkeypatch):
+    monkeypatch.setattr(_frame_cache, 'CACHE_DIR', '')
+    source = tmp_path / 'table.csv.xz'
+    source.write_bytes(b'')
+    _frame_cache._write_cached_frame(str(source), make_frame())
+    assert list(tmp_path.iterdir()) == [source]
+    assert _frame_cache._read_cached_frame(str(source), __file__) is None
+
+
+def test_cache_round_trips_without_pickle(tmp_path, monkeypatch):
+    cache_dir = tmp_path / 'cache'
+    monkeypatch.setattr(_frame_cache, 'CACHE_DIR', str(cache_dir))
+    source = tmp_path / 'table.csv.xz'
+    source.write_bytes(b'')
+    df = make_frame()
+    _frame_cache._write_cached_frame(str(source), df)
+    assert [p.suffix for p in cache_dir.iterdir()] == ['.npz']
+    pd.testing.assert_frame_equal(_frame_cache._read_cached_frame(str(source), __file__), df)
+
+
+def test_unreadable_cache_is_a_miss(tmp_path, monkeypatch):
+    monkeypatch.setattr(_frame_cache, 'CACHE_DIR', str(tmp_path))
+    source = tmp_path / 'table.csv.xz'
+    source.write_bytes(b'')
+    _frame_cache._write_cached_frame(str(source), make_frame())
+    with open(_frame_cache._cache_path(str(source)), 'wb') as f:
+        f.write(b'not a zip file')
+    assert _frame_cache._read_cached_frame(str(source), __file__) is None
@@ -0,0 +1,96 @@
+"""Tests for HijriDate/iTimedelta in the top-level ``HijriDate.py`` script."""
+
+import importlib.util
+import pickle
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "HijriDate.py"
+
+
+def load_script():
+    """Import the script as a module; the repo root is not a package."""
+    spec = importlib.util.spec_from_file_location("hijri_date_script", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    # Registered so pickle can find the classes by module name
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+hd = load_script()
+HijriDate, iTimedelta = hd.HijriDate, hd.iTimedelta
+
+
+def test_date_fields_are_read_only():
+    d = HijriDate(1447, 1, 1)
+    assert d < HijriDate(1447, 1, 2)  # fills the cached comparison key
+    with pytest.raises(AttributeError):
+        d.day = 5
+    assert (d.year, d.month, d.day) == (1447, 1, 1)
+    assert d == HijriDate(1447, 1, 1)
+    assert hash(d) == hash(HijriDate(1447, 1, 1))
+
+
+def test_isoformat_cache_follows_the_date():
+    d = HijriDate(1447, 1, 1)
+    assert str(d) == "1447-01-01"
+    with pytest.raises(AttributeError):
+        d.day = 5
+    assert d.isoformat() == "1447-01-01"
+    assert str(d + iTimedelta(4)) == "1447-01-05"
+
+
+def test_idate_results_cannot_be_corrupted():
+    start, length = hd.idate(1447, 2)
+    with pytest.raises(AttributeError):
+        length.days = 1
+    td = length
+    td += iTimedelta(5)
+    assert td.days == 35
+    assert hd.idate(1447, 2) == (HijriDate(1447, 2, 1), iTimedelta(30))
+
+
+def test_from_arrays_broadcasts_and_validates():
+    dates = HijriDate.from_arrays(1447, [1, 2, 12], [1, 15, 30])
+    assert dates.shape == (3,)
+    assert list(dates) == [HijriDate(1447, 1, 1), HijriDate(1447, 2, 15), HijriDate(1447, 12, 30)]
+    assert dates[1] < dates[2]
+    with pytest.raises(ValueError):
+        HijriDate.from_arrays([1447, 1447], [1, 13], [1, 1])
+    with pytest.raises(ValueError):
+        HijriDate.from_arrays([1447], [1], [31])
+
+
+def test_from_ordinals_matches_scalar_conversion():
+    dates = [HijriDate(1447, 1, 1), HijriDate(1447, 12, 24), HijriDate(1, 1, 1)]
+    ordinals = np.array([d._to_ordinal() for d in dates]).reshape(3, 1)
+    result = HijriDate.from_ordinals(ordinals)
+    assert result.shape == (3, 1)
+    assert list(result.ravel()) == dates
+    assert HijriDate.from_ordinals([ordinals[0, 0] + 400])[0] == HijriDate._from_ordinal(ordinals[0, 0] + 400)
+
+
+def test_pickle_round_trips():
+    d = HijriDate(1447, 2, 5)
+    d < HijriDate(1447, 2, 6)  # fill the cached key before pickling
+    copy = pickle.loads(pickle.dumps(d))
+    assert copy == d and hash(copy) == hash(d) and str(copy) == "1447-02-05"
+    td = pickle.loads(pickle.dumps(iTimedelta(400)))
+    assert td == iTimedelta(400)
+    assert pickle.loads(pickle.dumps(iTimedelta(30))) is iTimedelta(30)
+
+
+@pytest.mark.parametrize("days", [5, 500])
+def test_augmented_assignment_never_mutates(days):
+    a = iTimedelta(days)
+    b = a
+    seen = {a}
+    a += iTimedelta(1)
+    assert a == iTimedelta(days + 1) and a is not b
+    assert b == iTimedelta(days) and b in seen
+    a -= iTimedelta(2)
+    assert a == iTimedelta(days - 1) and b == iTimedelta(days)
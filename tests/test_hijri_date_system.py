@@ -0,0 +1,63 @@
+"""Tests for the HijriDateMapper in the top-level ``Hijri Date System.py`` script."""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).resolve().parent.parent / "Hijri Date System.py"
+
+
+def load_script():
+    """Import the script as a module (its file name is not a valid module name)."""
+    spec = importlib.util.spec_from_file_location("hijri_date_system", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+hds = load_script()
+
+
+@pytest.fixture(params=[True, False], ids=["indexed", "unindexed"])
+def mapper(request):
+    return hds.HijriDateMapper(build_index=request.param)
+
+
+@pytest.mark.parametrize("query", [(None, None, None), (None, 1, 15), (None, 7, None)])
+def test_missing_year_matches_nothing(mapper, query):
+    result, first_index, span = mapper.to_hijri(*query)
+    assert result.empty and first_index is None and span == 0
+    result, first_index, span = mapper.to_greg(*query)
+    assert result.empty and first_index is None and span == 0
+    assert mapper.get_match_indexes(*query) == (None, None, 0)
+    assert mapper.get_match_indexes(*query, date_type='hijri') == (None, None, 0)
+
+
+def test_bulk_conversions_keep_query_order(mapper):
+    result, missing = mapper.to_hijri_many([2024, 2030, 2024, 2024], [2, 1, 1, 13], [10, 1, 15, 1])
+    assert missing.tolist() == [False, True, False, True]
+    assert list(zip(result['h_year'], result['h_month'], result['h_day'])) == [(1445, 8, 1), (1445, 7, 4)]
+
+    result, missing = mapper.to_greg_many([1445, 1445], [7, 7], [5, 40])
+    assert missing.tolist() == [False, True]
+    assert list(zip(result['g_year'], result['g_month'], result['g_day'])) == [(2024, 1, 16)]
+
+
+@pytest.mark.parametrize("query, expected", [
+    ((1445.0, 7, 4), [(2024, 1, 15)]),
+    ((1445, 7.0, None), [(2024, 1, 15), (2024, 1, 16), (2024, 1, 17)]),
+    ((1445.5, 7, 4), []),
+    ((1445, 7, 4.5), []),
+    (("1445", 7, None), []),
+])
+def test_non_int_components_match_like_integers(mapper, query, expected):
+    result, _, _ = mapper.to_greg(*query)
+    assert list(zip(result['g_year'], result['g_month'], result['g_day'])) == expected
+
+
+def test_out_of_range_columns_are_rejected_not_wrapped():
+    data = hds.HijriDateMapper().df.astype({'g_year': 'int64'})
+    data.loc[0, 'g_year'] = 40000
+    with pytest.raises(ValueError, match="g_year"):
+        hds.HijriDateMapper(data)
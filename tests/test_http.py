@@ -0,0 +1,103 @@
+"""Tests for the shared Aladhan HTTP helpers (network mocked)."""
+
+import asyncio
+import sys
+import types
+
+import pytest
+
+from hijri_datetime.api.aladhan import _http
+
+
+class FakeResponse:
+    def __init__(self, body):
+        self.body = body
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    async def read(self):
+        return self.body
+
+
+@pytest.fixture
+def fake_aiohttp(monkeypatch):
+    """Install a minimal aiohttp that records sessions and serves canned JSON."""
+    module = types.ModuleType('aiohttp')
+    module.sessions = []
+    module.ClientError = OSError
+    module.TCPConnector = lambda **kwargs: kwargs
+    module.ClientTimeout = lambda **kwargs: kwargs
+
+    class ClientSession:
+        def __init__(self, connector=None, timeout=None):
+            self.timeout = timeout
+            self.urls = []
+            module.sessions.append(self)
+
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+        def get(self, url, headers=None):
+            self.urls.append(url)
+            return FakeResponse(b'{"code": 200, "data": "%s"}' % url.encode())
+
+    module.ClientSession = ClientSession
+    monkeypatch.setitem(sys.modules, 'aiohttp', module)
+    monkeypatch.setattr(_http, 'CACHE_DIR', '')
+    monkeypatch.setattr(_http, '_MEMORY_CACHE', {})
+    return module
+
+
+def test_batch_session_has_timeouts(fake_aiohttp):
+    urls = [f"https://api.aladhan.com/v1/x/{i}" for i in range(3)]
+    results = asyncio.run(_http._fetch_json_many_async(urls, urls))
+    assert [r['data'] for r in results] == urls
+    connect, read = _http.REQUEST_TIMEOUT
+    assert fake_aiohttp.sessions[0].timeout == {
+        'total': connect + read, 'connect': connect, 'sock_read': read}
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    monkeypatch.setattr(_http, '_MEMORY_CACHE', {})
+    monkeypatch.setattr(_http, 'CACHE_DIR', '')
+    return _http
+
+
+URL = "https://api.aladhan.com/v1/gToH/01-01-2024?calendarMethod=HJCoSA"
+BODY = b'{"code": 200, "data": {"hijri": {"date": "19-06-1445"}}}'
+
+
+def test_cache_get_returns_copies(cache):
+    cache.cache_put(URL, BODY, cache.json_loads(BODY))
+    first = cache.cache_get(URL)
+    first['data']['hijri']['date'] = 'changed'
+    assert cache.cache_get(URL)['data']['hijri']['date'] == '19-06-1445'
+    assert cache.cache_get(URL) is not cache.cache_get(URL)
+
+
+def test_failed_responses_are_not_cached(cache):
+    cache.cache_put(URL, b'{"code": 400}', {'code': 400})
+    assert cache.cache_get(URL) is None
+
+
+def test_disk_layer_is_opt_in(cache, tmp_path, monkeypatch):
+    cache.cache_put(URL, BODY, cache.json_loads(BODY))
+    cache._MEMORY_CACHE.clear()
+    assert cache.cache_get(URL) is None
+
+    monkeypatch.setattr(_http, 'CACHE_DIR', str(tmp_path))
+    cache.cache_put(URL, BODY, cache.json_loads(BODY))
+    cache._MEMORY_CACHE.clear()
+    assert cache.cache_get(URL)['data']['hijri']['date'] == '19-06-1445'
+    assert len(list(tmp_path.iterdir())) == 1
@@ -0,0 +1,47 @@
+"""Tests for the vectorized batch conversions of untitled5.HijriDateMapper."""
+
+import pytest
+
+from hijri_datetime.untitled5 import HijriDateMapper
+
+
+@pytest.fixture
+def mapper():
+    """Mapper over the bundled eight-row sample."""
+    return HijriDateMapper()
+
+
+def test_to_hijri_batch_mixes_dates_months_and_years(mapper):
+    result = mapper.to_hijri_batch([2024, 2030, 2025, 2024], [1, 1, None, 2], [16, 1, None, None])
+    assert result['query'].tolist() == [0, 2, 2, 2, 3, 3]
+    assert result['h_day'].tolist() == [5, 25, 26, 10, 1, 2]
+
+
+def test_batch_matches_single_lookups(mapper):
+    batch = mapper.to_greg_batch([1445, 1446], [7, 9], [None, 10])
+    for query, (year, month, day) in enumerate([(1445, 7, None), (1446, 9, 10)]):
+        single, _, _ = mapper.to_greg(year, month, day)
+        rows = batch[batch['query'] == query].drop(columns='query')
+        assert rows.equals(single)
+
+
+def test_batch_rejects_out_of_range_parts(mapper):
+    # Month 13 of 2024 would pack like January 2025 without the range check
+    result = mapper.to_hijri_batch([2024, None], [13, 1], [5, 15])
+    assert result.empty and 'query' in result
+
+
+def test_empty_batch(mapper):
+    assert mapper.to_greg_batch([]).empty
+
+
+def test_range_memo_is_bounded_and_skips_misses(mapper, monkeypatch):
+    from hijri_datetime import untitled5
+    monkeypatch.setattr(untitled5, '_RANGE_CACHE_SIZE', 2)
+    for year in range(1900, 1950):
+        assert mapper.to_hijri(year, None, None)[0].empty
+    assert mapper._greg_ranges == {}
+    for query in [(2024, 1, None), (2024, 2, None), (2025, None, None)]:
+        assert not mapper.to_hijri(*query)[0].empty
+    assert list(mapper._greg_ranges) == [(2024, 2, None), (2025, None, None)]
+    assert len(mapper.to_hijri(2024, 1, None)[0]) == 3